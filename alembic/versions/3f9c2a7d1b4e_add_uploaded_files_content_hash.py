@@ -0,0 +1,41 @@
+"""add uploaded_files.content_hash
+
+Revision ID: 3f9c2a7d1b4e
+Revises: 
+Create Date: 2026-10-15 23:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a7d1b4e"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    """Databases created by init_db's create_all may already have the column."""
+    inspector = sa.inspect(op.get_bind())
+    return column in {c["name"] for c in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    if _has_column("uploaded_files", "content_hash"):
+        return
+    # Batch mode so SQLite, which cannot ALTER in a constraint, recreates the table
+    with op.batch_alter_table("uploaded_files") as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+        batch_op.create_unique_constraint(
+            "uq_uploaded_files_project_hash", ["project_id", "content_hash"]
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("uploaded_files") as batch_op:
+        batch_op.drop_constraint("uq_uploaded_files_project_hash", type_="unique")
+        batch_op.drop_column("content_hash")
@@ -0,0 +1,41 @@
+"""set projects.updated_at server default
+
+Revision ID: 8d41e6c0a2f7
+Revises: 3f9c2a7d1b4e
+Create Date: 2026-10-15 23:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.database import utcnow
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d41e6c0a2f7"
+down_revision: Union[str, None] = "3f9c2a7d1b4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Batch mode so SQLite, which cannot ALTER a column default, recreates the table
+    with op.batch_alter_table("projects") as batch_op:
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=utcnow(),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("projects") as batch_op:
+        batch_op.alter_column(
+            "updated_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -2,8 +2,10 @@
 
 from typing import Optional
 from fastapi import APIRouter, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field
 
+from app.core.cache import cached_list, invalidate_list_cache
 from app.core.dependencies import DatabaseDep, RequireRead, RequireWrite
 from app.core.exceptions import ValidationError
 from app.services.dashboard_service import DashboardService
@@ -43,11 +45,15 @@ async def list_dashboards(
     project_id: Optional[int] = None,
 ):
     """List dashboards."""
-    # Don't filter by user_id to show all dashboards in the project
-    dashboards = await DashboardService.list_dashboards(
-        db, skip=skip, limit=limit, user_id=None, project_id=project_id
-    )
-    return dashboards
+    async def load():
+        # Don't filter by user_id to show all dashboards in the project
+        dashboards = await DashboardService.list_dashboards(
+            db, skip=skip, limit=limit, user_id=None, project_id=project_id
+        )
+        # Encode while the session is open; cached entries outlive it
+        return jsonable_encoder(dashboards)
+
+    return await cached_list("dashboards", (skip, limit, project_id), load)
 
 
 @router.get("/{dashboard_id}")
@@ -94,6 +100,7 @@ async def create_dashboard(
             semantic_schema=semantic_schema,
         )
         await db.commit()
+        invalidate_list_cache("dashboards")
         return dashboard
     except ValidationError as e:
         raise HTTPException(
@@ -120,6 +127,7 @@ async def update_dashboard(
             updated_by=user.get("id", "system"),
         )
         await db.commit()
+        invalidate_list_cache("dashboards")
         return dashboard
     except ValidationError as e:
         raise HTTPException(
@@ -143,4 +151,5 @@ async def delete_dashboard(
     # Soft delete
     dashboard.is_active = False
     await db.commit()
+    invalidate_list_cache("dashboards")
 
@@ -7,6 +7,7 @@ from typing import Optional, Any
 from fastapi import APIRouter, HTTPException, status, Query
 from pydantic import BaseModel, Field
 
+from app.core.cache import cached_list, invalidate_list_cache
 from app.core.dependencies import DatabaseDep, RequireRead, RequireWrite
 from app.core.exceptions import DatasetNotFoundError
 from app.services.dataset_service import DatasetService
@@ -62,10 +63,13 @@ async def list_datasets(
     project_id: Optional[int] = None,
 ):
     """List all active datasets."""
-    datasets = await DatasetService.list_datasets(
-        db, skip=skip, limit=limit, project_id=project_id
-    )
-    return datasets
+    async def load():
+        datasets = await DatasetService.list_datasets(
+            db, skip=skip, limit=limit, project_id=project_id
+        )
+        return [DatasetResponse.model_validate(d) for d in datasets]
+
+    return await cached_list("datasets", (skip, limit, project_id), load)
 
 
 @router.get("/{dataset_id}", response_model=DatasetResponse)
@@ -106,6 +110,7 @@ async def create_dataset(
             created_by=user.get("id", "system"),
         )
         await db.commit()
+        invalidate_list_cache("datasets")
         return dataset
     except Exception as e:
         raise HTTPException(
@@ -130,6 +135,7 @@ async def update_dataset(
             updated_by=user.get("id", "system"),
         )
         await db.commit()
+        invalidate_list_cache("datasets")
         return dataset
     except DatasetNotFoundError as e:
         raise HTTPException(
@@ -151,6 +157,7 @@ async def delete_dataset(
             updated_by=user.get("id", "system"),
         )
         await db.commit()
+        invalidate_list_cache("datasets")
     except DatasetNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
@@ -51,6 +51,33 @@ async def validate_dataset_deletion(
         )
 
 
+@router.post("/datasets/validate-deletion")
+async def validate_datasets_deletion(
+    dataset_ids: list[str],
+    db: DatabaseDep,
+    user: RequireWrite,
+    force: bool = Query(False, description="Force deletion even if used"),
+):
+    """Validate if several datasets can be safely deleted."""
+    try:
+        results = await DependencySafetyService.validate_dataset_deletion_many(
+            db, dataset_ids, force=force
+        )
+
+        return {
+            dataset_id: {
+                "can_delete": can_delete,
+                "error_message": error_msg,
+                "usage_info": usage_info,
+            }
+            for dataset_id, (can_delete, error_msg, usage_info) in results.items()
+        }
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        )
+
+
 @router.post("/dataset/{dataset_id}/semantic-impact")
 async def check_semantic_change_impact(
     dataset_id: str,
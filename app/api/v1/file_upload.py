@@ -1,6 +1,6 @@
 """File upload API routes."""
 
-from fastapi import APIRouter, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, status, UploadFile, File, Form, Query
 
 from app.core.dependencies import DatabaseDep, RequireRead, RequireWrite
 from app.core.exceptions import ValidationError
@@ -14,9 +14,13 @@ async def list_uploaded_files(
     project_id: int,
     db: DatabaseDep,
     user: RequireRead,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
 ):
     """List uploaded files for a project."""
-    files = await FileUploadService.list_uploaded_files(db, project_id)
+    files = await FileUploadService.list_uploaded_files(
+        db, project_id, skip=skip, limit=limit
+    )
     return files
 
 
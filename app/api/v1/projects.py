@@ -1,9 +1,12 @@
 """Project management API routes."""
 
 from typing import Optional
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
+from app.core.cache import cached_list, invalidate_list_cache
 from app.core.dependencies import DatabaseDep, RequireRead, RequireWrite
 from app.core.exceptions import ValidationError
 from app.services.project_service import ProjectService
@@ -25,29 +28,44 @@ class ProjectUpdate(BaseModel):
     description: Optional[str] = None
 
 
-@router.get("")
+@router.get("", response_class=ORJSONResponse)
 async def list_projects(
     db: DatabaseDep,
     user: RequireRead,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
+    after_updated_at: Optional[datetime] = Query(
+        None, description="Keyset cursor: updated_at of the last project seen"
+    ),
+    after_id: Optional[int] = Query(
+        None, description="Keyset cursor: id of the last project seen"
+    ),
 ):
     """List all active projects."""
-    # Don't filter by user_id by default to show all projects
-    projects = await ProjectService.list_projects(
-        db, skip=skip, limit=limit, user_id=user_id
+    cursor = None
+    if after_updated_at is not None and after_id is not None:
+        cursor = (after_updated_at, after_id)
+
+    async def load():
+        # Don't filter by user_id by default to show all projects
+        projects = await ProjectService.list_projects(
+            db, skip=skip, limit=limit, user_id=user_id, cursor=cursor
+        )
+        # Convert SQLAlchemy models to dicts; orjson serializes datetimes natively
+        return [{
+            "id": p.id,
+            "name": p.name,
+            "description": p.description,
+            "created_at": p.created_at,
+            "updated_at": p.updated_at,
+            "created_by": p.created_by,
+            "is_active": p.is_active,
+        } for p in projects]
+
+    return ORJSONResponse(
+        await cached_list("projects", (skip, limit, user_id, cursor), load)
     )
-    # Convert SQLAlchemy models to dicts for JSON serialization
-    return [{
-        "id": p.id,
-        "name": p.name,
-        "description": p.description,
-        "created_at": p.created_at.isoformat() if p.created_at else None,
-        "updated_at": p.updated_at.isoformat() if p.updated_at else None,
-        "created_by": p.created_by,
-        "is_active": p.is_active,
-    } for p in projects]
 
 
 @router.get("/{project_id}")
@@ -81,6 +99,7 @@ async def create_project(
             created_by=user.get("id", "system"),
         )
         await db.commit()
+        invalidate_list_cache("projects")
         return project
     except ValidationError as e:
         raise HTTPException(
@@ -105,6 +124,7 @@ async def update_project(
             updated_by=user.get("id", "system"),
         )
         await db.commit()
+        invalidate_list_cache("projects")
         return project
     except ValidationError as e:
         raise HTTPException(
@@ -126,6 +146,7 @@ async def delete_project(
             updated_by=user.get("id", "system"),
         )
         await db.commit()
+        invalidate_list_cache("projects")
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
@@ -43,7 +43,7 @@ async def execute_query(
             semantic_schema = {}
 
         # Build query
-        query = QueryEngine.build_query(
+        query, params = QueryEngine.build_query(
             dataset_table=dataset.table_name,
             schema_name=dataset.schema_name,
             dimensions=request.dimensions,
@@ -54,14 +54,12 @@ async def execute_query(
             semantic_schema=semantic_schema,
         )
 
-        # Optimize query
-        query = QueryEngine.optimize_query(query)
-
-        # Execute query
-        results = await QueryEngine.execute_query(db, query)
+        # Execute query; built queries are read-only reports, safe to cache briefly
+        results = await QueryEngine.execute_query(db, query, params, cache=True)
 
         return {
             "query": query,
+            "params": params,
             "results": results,
             "row_count": len(results),
         }
@@ -8,6 +8,7 @@ Connects to PostgreSQL database (analytics-llm) for real data.
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, Query, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
@@ -40,6 +41,22 @@ AnalyticsSessionLocal = async_sessionmaker(
 )
 
 
+# ============================================
+# Static Queries
+# ============================================
+
+# Fixed-text queries are built once at import instead of per request
+_LAST_DATE_QUERY = text("SELECT MAX(asondate) as last_date FROM sales_analytics")
+
+_DISTINCT_VALUE_QUERIES = {
+    column: text(
+        f"SELECT DISTINCT {column} FROM sales_analytics "
+        f"WHERE {column} IS NOT NULL ORDER BY {column}"
+    )
+    for column in ("period", "customer_state", "industry", "brand")
+}
+
+
 async def get_analytics_db():
     """Get analytics database session."""
     async with AnalyticsSessionLocal() as session:
@@ -281,9 +298,7 @@ async def get_report_meta():
     async with AnalyticsSessionLocal() as session:
         try:
             # Get last updated from max date in data
-            result = await session.execute(text(
-                "SELECT MAX(asondate) as last_date FROM sales_analytics"
-            ))
+            result = await session.execute(_LAST_DATE_QUERY)
             row = result.fetchone()
             last_date = row[0] if row else datetime.now().date()
             
@@ -312,9 +327,10 @@ async def get_report_meta():
 
 async def get_distinct_values(session: AsyncSession, column: str) -> List[str]:
     """Get distinct non-null values from a column."""
-    result = await session.execute(text(
-        f"SELECT DISTINCT {column} FROM sales_analytics WHERE {column} IS NOT NULL ORDER BY {column}"
-    ))
+    query = _DISTINCT_VALUE_QUERIES.get(column)
+    if query is None:
+        raise ValueError(f"Unsupported distinct-value column: {column}")
+    result = await session.execute(query)
     return [row[0] for row in result.fetchall()]
 
 
@@ -430,7 +446,7 @@ async def get_report_kpis(request: KpisRequest):
             raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/sales-analytics/table")
+@router.post("/sales-analytics/table", response_class=ORJSONResponse)
 async def get_report_table(request: TableRequest):
     """Get paginated table data with filtering, sorting, and search."""
     async with AnalyticsSessionLocal() as session:
@@ -630,20 +646,20 @@ async def get_report_table(request: TableRequest):
                     "overall_margin": calc_margin("overall_actualSales", "overall_profitLoss"),
                 }
             
-            return {
+            return ORJSONResponse({
                 "rows": rows,
                 "page": request.pagination.page,
                 "pageSize": request.pagination.pageSize,
                 "total": total,
                 "summary": summary,
-            }
+            })
             
         except Exception as e:
             logger.error(f"Error fetching table data: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/sales-analytics/drilldown")
+@router.post("/sales-analytics/drilldown", response_class=ORJSONResponse)
 async def get_report_drilldown(request: DrilldownRequest):
     """Get detailed drilldown data for a specific entity."""
     async with AnalyticsSessionLocal() as session:
@@ -714,7 +730,7 @@ async def get_report_drilldown(request: DrilldownRequest):
                 for row in breakdown_rows
             ]
             
-            return {
+            return ORJSONResponse({
                 "entity": {
                     "id": request.entityId,
                     "name": params["entity_id"],
@@ -731,14 +747,14 @@ async def get_report_drilldown(request: DrilldownRequest):
                 "breakdown": {
                     "byCategory": breakdown_data,
                 },
-            }
+            })
             
         except Exception as e:
             logger.error(f"Error fetching drilldown: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/sales-analytics/export")
+@router.post("/sales-analytics/export", response_class=ORJSONResponse)
 async def export_report(request: TableRequest):
     """Export report data as CSV."""
     async with AnalyticsSessionLocal() as session:
@@ -771,10 +787,10 @@ async def export_report(request: TableRequest):
             for row in rows:
                 csv_lines.append(f'"{row[0]}",{row[1]},{row[2]},{row[3]},{row[4]},{row[5]}')
             
-            return {
+            return ORJSONResponse({
                 "csv": "\n".join(csv_lines),
                 "filename": f"sales_analytics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            }
+            })
             
         except Exception as e:
             logger.error(f"Error exporting data: {e}")
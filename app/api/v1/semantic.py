@@ -2,11 +2,12 @@
 
 from typing import Optional
 from fastapi import APIRouter, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, Field
 
 from app.core.dependencies import RequireRead
 from app.core.exceptions import ValidationError
-from app.services.semantic_service import SemanticService
+from app.services.semantic_service import SemanticService, SemanticLayer
 from app.services.dataset_service import DatasetService
 
 router = APIRouter()
@@ -43,8 +44,10 @@ async def validate_semantic_schema(
     response = SemanticSchemaResponse(is_valid=is_valid, error_message=error)
 
     if is_valid:
-        response.ui_fields = SemanticService.parse_semantic_to_ui_fields(request.schema_json)
-        response.validation_rules = SemanticService.get_validation_rules(request.schema_json)
+        layer = SemanticLayer.from_json(request.schema_json, validated=True)
+        # The layer's fields/rules are read-only mappings; encode them to plain JSON
+        response.ui_fields = jsonable_encoder(layer.ui_fields)
+        response.validation_rules = jsonable_encoder(layer.validation_rules)
 
     return response
 
@@ -57,7 +60,7 @@ async def parse_semantic_schema(
     """Parse semantic schema into UI fields."""
     try:
         ui_fields = SemanticService.parse_semantic_to_ui_fields(request.schema_json)
-        return ui_fields
+        return jsonable_encoder(ui_fields)
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
@@ -0,0 +1,156 @@
+"""In-process cache for read-heavy list endpoints."""
+
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from cachetools import TTLCache
+from sqlalchemy.engine import make_url
+
+from app.core.config import get_settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Serialized list responses keyed on (namespace, query parameters). Writes in
+# this process invalidate their namespace; other workers hear about them through
+# the PostgreSQL listener below, with the TTL as the backstop.
+_list_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+# Bumped on every invalidation so a load that raced a write is not stored
+_generation = 0
+
+
+async def cached_list(
+    namespace: str, key: Hashable, loader: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Return a cached list response, loading and storing it on a miss.
+
+    Cached values are shared between requests and must not be mutated.
+
+    Args:
+        namespace: Resource the list belongs to (e.g. "projects")
+        key: Hashable summary of the query parameters
+        loader: Coroutine factory producing the serialized response
+
+    Returns:
+        Cached or freshly loaded response
+    """
+    cache_key = (namespace, key)
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    generation = _generation
+    value = await loader()
+    if generation == _generation:
+        _list_cache[cache_key] = value
+    return value
+
+
+def cache_generation() -> int:
+    """
+    Current invalidation generation.
+
+    Changes on every invalidation, local or heard from another worker, so
+    other in-process caches can drop entries loaded before a write.
+    """
+    return _generation
+
+
+def invalidate_list_cache(namespace: Optional[str] = None) -> None:
+    """
+    Drop cached list responses.
+
+    Call after committing a write that changes what a list endpoint returns.
+
+    Args:
+        namespace: Resource to invalidate, or None to drop everything
+    """
+    global _generation
+    _generation += 1
+    if namespace is None:
+        _list_cache.clear()
+        return
+    for cache_key in [k for k in _list_cache.keys() if k[0] == namespace]:
+        _list_cache.pop(cache_key, None)
+
+
+# =============================================================================
+# Cross-process invalidation (PostgreSQL LISTEN/NOTIFY)
+# =============================================================================
+
+# Channel and tables whose writes invalidate the list cache; each table name is
+# also the cache namespace of its list endpoint
+INVALIDATION_CHANNEL = "cache_invalidate"
+_INVALIDATING_TABLES = ("projects", "datasets", "dashboards")
+
+_NOTIFY_FUNCTION_DDL = f"""
+CREATE OR REPLACE FUNCTION notify_cache_invalidate() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('{INVALIDATION_CHANNEL}', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Statement-level so a bulk write sends one notification; tolerates another
+# worker creating the trigger concurrently
+_TRIGGER_DDL = """
+DO $$
+BEGIN
+    CREATE TRIGGER cache_invalidate
+        AFTER INSERT OR UPDATE OR DELETE ON {table}
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidate();
+EXCEPTION WHEN duplicate_object THEN
+    NULL;
+END;
+$$;
+"""
+
+
+def _on_invalidation(connection: Any, pid: int, channel: str, payload: str) -> None:
+    """asyncpg listener: drop the namespace named in the notification."""
+    invalidate_list_cache(payload or None)
+
+
+async def start_invalidation_listener() -> Optional[Any]:
+    """
+    Listen for table-change notifications so every worker's cache stays fresh.
+
+    Installs the notify triggers if missing, then holds a dedicated asyncpg
+    connection subscribed to INVALIDATION_CHANNEL. Only PostgreSQL supports
+    this; elsewhere the TTL alone bounds staleness.
+
+    Returns:
+        The listening connection, or None if not listening
+    """
+    url = make_url(get_settings().database_url)
+    if url.get_backend_name() != "postgresql":
+        return None
+
+    import asyncpg
+
+    dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+    try:
+        connection = await asyncpg.connect(dsn)
+    except Exception as e:
+        logger.warning(f"Cache invalidation listener not started: {e}")
+        return None
+
+    try:
+        await connection.execute(_NOTIFY_FUNCTION_DDL)
+        for table in _INVALIDATING_TABLES:
+            await connection.execute(_TRIGGER_DDL.format(table=table))
+    except Exception as e:
+        # e.g. no privilege to create triggers; listen anyway in case they exist
+        logger.warning(f"Could not install cache invalidation triggers: {e}")
+
+    await connection.add_listener(INVALIDATION_CHANNEL, _on_invalidation)
+    logger.info(f"Listening for cache invalidations on '{INVALIDATION_CHANNEL}'")
+    return connection
+
+
+async def stop_invalidation_listener(connection: Optional[Any]) -> None:
+    """Close a connection returned by start_invalidation_listener."""
+    if connection is not None:
+        await connection.close()
@@ -1,13 +1,17 @@
 """Database connection and session management."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
+from sqlalchemy import DateTime
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.core.config import get_settings
 from app.core.exceptions import DatabaseConnectionError
@@ -16,6 +20,42 @@ from app.core.logging_config import get_logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+
+def _json_serializer(obj: Any) -> str:
+    """Serialize JSON columns (e.g. semantic schemas) with orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class utcnow(FunctionElement):
+    """
+    Database-side current time as a naive UTC timestamp.
+
+    Use for server defaults on naive DateTime columns, whose Python-side
+    values are datetime.utcnow. Plain func.now() would store server-local
+    time, and on SQLite a second-precision string that does not compare
+    with bound datetimes.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element: utcnow, compiler: Any, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element: utcnow, compiler: Any, **kw: Any) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element: utcnow, compiler: Any, **kw: Any) -> str:
+    # Same text format SQLAlchemy stores for datetimes (microsecond digits)
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
 # Create async engine
 # Handle SQLite vs PostgreSQL connection parameters
 connect_args = {}
@@ -25,6 +65,8 @@ if "sqlite" in settings.database_url:
         "url": settings.database_url,
         "echo": settings.DB_ECHO,
         "connect_args": connect_args,
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
     }
 else:
     engine_kwargs = {
@@ -33,6 +75,8 @@ else:
         "max_overflow": settings.DB_MAX_OVERFLOW,
         "echo": settings.DB_ECHO,
         "pool_pre_ping": True,
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
     }
 
 engine = create_async_engine(**engine_kwargs)
@@ -1,39 +1,47 @@
 """Logging configuration."""
 
+import json
 import logging
 import sys
-from typing import Any
+from typing import Any, Optional
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
 
+class JSONFormatter(logging.Formatter):
+    """JSON log formatter."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data: dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            log_data["exception"] = self.formatException(record.exc_info)
+        if hasattr(record, "extra"):
+            log_data.update(record.extra)
+        return json.dumps(log_data)
+
+
+# Handler installed by setup_logging, kept so repeat calls don't stack handlers
+_handler: Optional[logging.Handler] = None
+
+
 def setup_logging() -> None:
-    """Configure application logging."""
+    """Configure application logging (idempotent; later calls are no-ops)."""
+    global _handler
+    if _handler is not None:
+        return
+
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 
     if settings.LOG_FORMAT == "json":
         # JSON logging for production
-        import json
-
-        class JSONFormatter(logging.Formatter):
-            """JSON log formatter."""
-
-            def format(self, record: logging.LogRecord) -> str:
-                log_data: dict[str, Any] = {
-                    "timestamp": self.formatTime(record, self.datefmt),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                }
-                if record.exc_info:
-                    log_data["exception"] = self.formatException(record.exc_info)
-                if hasattr(record, "extra"):
-                    log_data.update(record.extra)
-                return json.dumps(log_data)
-
-        formatter = JSONFormatter()
+        formatter: logging.Formatter = JSONFormatter()
     else:
         # Text logging for development
         formatter = logging.Formatter(
@@ -48,6 +56,7 @@ def setup_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     root_logger.addHandler(handler)
+    _handler = handler
 
     # Set levels for third-party loggers
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
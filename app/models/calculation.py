@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Integer, JSON
+from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Integer, JSON, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,6 +13,15 @@ class CalculatedMeasure(Base):
     """Calculated measure definition."""
 
     __tablename__ = "calculated_measures"
+    __table_args__ = (
+        # Partial index for active-measure counts per dataset (dependency checks)
+        Index(
+            "ix_calculated_measures_active_dataset",
+            "dataset_id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     dataset_id: Mapped[str] = mapped_column(
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Integer, JSON
+from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Integer, JSON, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,6 +13,15 @@ class Dashboard(Base):
     """Dashboard definition."""
 
     __tablename__ = "dashboards"
+    __table_args__ = (
+        # Partial index so active-dashboard counts can use an index-only scan
+        Index(
+            "ix_dashboards_active",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     project_id: Mapped[Optional[int]] = mapped_column(
@@ -3,24 +3,36 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Integer
+from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Integer, UniqueConstraint, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class Project(Base):
     """Project model for workspace isolation."""
 
     __tablename__ = "projects"
+    # Fetch server-generated timestamps via RETURNING (no lazy load under asyncio)
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Serves list_projects ordering and keyset pagination
+        Index(
+            "ix_projects_active_updated",
+            "is_active",
+            text("updated_at DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Set by the database, in UTC like created_at so keyset cursors compare like-for-like
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=utcnow(), onupdate=utcnow()
     )
     created_by: Mapped[str] = mapped_column(String(100), nullable=False)
     updated_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -80,6 +92,9 @@ class UploadedFile(Base):
     """Uploaded file metadata (CSV/XLSX)."""
 
     __tablename__ = "uploaded_files"
+    __table_args__ = (
+        UniqueConstraint("project_id", "content_hash", name="uq_uploaded_files_project_hash"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     project_id: Mapped[int] = mapped_column(
@@ -90,6 +105,9 @@ class UploadedFile(Base):
     file_path: Mapped[str] = mapped_column(String(1000), nullable=False)  # Storage path
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)  # Bytes
     file_type: Mapped[str] = mapped_column(String(50), nullable=False)  # csv, xlsx
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True
+    )  # SHA-256 of file content, for per-project deduplication
     row_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     column_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     is_processed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Integer, Table, Column
+from sqlalchemy import String, Text, DateTime, Boolean, ForeignKey, Integer, Table, Column, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -28,6 +28,15 @@ class User(Base):
     """User model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Partial index for permission lookups, which only consider active users
+        Index(
+            "ix_users_id_active",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(100), primary_key=True)
     email: Mapped[str] = mapped_column(String(200), unique=True, nullable=False)
@@ -51,6 +60,15 @@ class Role(Base):
     """Role model."""
 
     __tablename__ = "roles"
+    __table_args__ = (
+        # Partial index for permission lookups, which skip inactive roles
+        Index(
+            "ix_roles_id_active",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
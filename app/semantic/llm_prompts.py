@@ -12,8 +12,12 @@ IMPORTANT: This file is separate from the semantic JSON to allow:
 - Different prompts for different LLM providers
 """
 
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple, Any
 
+import orjson
+from cachetools import LRUCache
+
 
 # =============================================================================
 # SYSTEM PROMPT - Comprehensive SQL Generation Guide
@@ -114,6 +118,9 @@ SYSTEM_PROMPT = """You are an expert SQL analyst for a Sales Analytics system. Y
     - WRONG: `ORDER BY total_sales DESC`
     - CORRECT: `ORDER BY total_sales DESC NULLS LAST`
 14. **Filter NULL aggregates** - For "top" queries, add `HAVING SUM(column) IS NOT NULL` to exclude groups with no data
+15. **Date ranges on asondate** - Filter with half-open ranges so the date index can be used; never wrap asondate in EXTRACT, DATE_TRUNC or casts in WHERE:
+    - WRONG: `WHERE EXTRACT(MONTH FROM asondate) = 10 AND EXTRACT(YEAR FROM asondate) = 2025`
+    - CORRECT: `WHERE asondate >= DATE '2025-10-01' AND asondate < DATE '2025-11-01'`
 
 ## OUTPUT FORMAT
 Return ONLY the SQL query. No explanations, no markdown code blocks, just the raw SQL.
@@ -509,6 +516,11 @@ def format_user_prompt(question: str, filters: Optional[Dict] = None) -> str:
     )
 
 
+def _dump_rows(rows: list) -> str:
+    """Compact JSON for result rows; non-JSON values (e.g. Decimal) fall back to str."""
+    return orjson.dumps(rows, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def format_answer_prompt(question: str, sql: str, results: Any) -> str:
     """
     Format the answer formatting prompt.
@@ -516,19 +528,22 @@ def format_answer_prompt(question: str, sql: str, results: Any) -> str:
     Args:
         question: Original user question
         sql: SQL query that was executed
-        results: Query results (list of dicts or similar)
+        results: Query results (list of dicts, or pre-serialized JSON)
         
     Returns:
         Formatted prompt for answer generation
     """
-    # Convert results to readable format
-    if isinstance(results, list):
+    # Serialize results as compact JSON (fewer prompt tokens than Python repr).
+    # Pre-serialized str/bytes results are embedded verbatim.
+    if isinstance(results, bytes):
+        results_str = results.decode()
+    elif isinstance(results, list):
         if len(results) == 0:
             results_str = "No results"
         elif len(results) <= 20:
-            results_str = str(results)
+            results_str = _dump_rows(results)
         else:
-            results_str = f"{str(results[:20])}\n... and {len(results) - 20} more rows"
+            results_str = f"{_dump_rows(results[:20])}\n... and {len(results) - 20} more rows"
     else:
         results_str = str(results)
     
@@ -552,6 +567,42 @@ def get_error_response(error_type: str) -> str:
     return ERROR_RESPONSES.get(error_type, ERROR_RESPONSES["sql_error"])
 
 
+def _render_example(index: int, example: Dict[str, str]) -> str:
+    """Render one few-shot example as it appears in the system prompt."""
+    return f"**Example {index}:**\nQuestion: {example['question']}\nSQL:\n{example['sql']}\n"
+
+
+# Examples are static, so render them once at import
+_RENDERED_EXAMPLES: Tuple[str, ...] = tuple(
+    _render_example(i, ex) for i, ex in enumerate(EXAMPLE_QA_PAIRS, 1)
+)
+
+
+@lru_cache(maxsize=None)
+def get_system_prompt_with_examples(include_examples: int = 5) -> str:
+    """
+    Get the system prompt with the first N few-shot examples appended.
+    
+    Args:
+        include_examples: Number of few-shot examples to include
+        
+    Returns:
+        System prompt string
+    """
+    if include_examples <= 0:
+        return SYSTEM_PROMPT
+    
+    return "\n".join([
+        SYSTEM_PROMPT,
+        "\n## EXAMPLE QUERIES\n",
+        *_RENDERED_EXAMPLES[:include_examples],
+    ])
+
+
+# (system_prompt, user_prompt) keyed by (question, encoded filters, include_examples)
+_complete_prompt_cache: LRUCache = LRUCache(maxsize=2048)
+
+
 def build_complete_prompt(
     question: str, 
     filters: Optional[Dict] = None,
@@ -568,19 +619,22 @@ def build_complete_prompt(
     Returns:
         Tuple of (system_prompt, user_prompt)
     """
-    # Build system prompt with examples
-    system_parts = [SYSTEM_PROMPT]
-    
-    if include_examples > 0:
-        examples = get_few_shot_examples(include_examples)
-        system_parts.append("\n## EXAMPLE QUERIES\n")
-        for i, ex in enumerate(examples, 1):
-            system_parts.append(f"**Example {i}:**")
-            system_parts.append(f"Question: {ex['question']}")
-            system_parts.append(f"SQL:\n{ex['sql']}\n")
-    
-    system_prompt = "\n".join(system_parts)
-    user_prompt = format_user_prompt(question, filters)
+    # Filters are a dict (unhashable); key the cache on their JSON encoding but
+    # render from the original object. Datetimes go through repr() so they do
+    # not collide with their ISO strings.
+    filters_key = orjson.dumps(
+        filters,
+        default=repr,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+    ) if filters else b""
+    key = (question, filters_key, include_examples)
     
-    return system_prompt, user_prompt
+    prompts = _complete_prompt_cache.get(key)
+    if prompts is None:
+        prompts = (
+            get_system_prompt_with_examples(include_examples),
+            format_user_prompt(question, filters),
+        )
+        _complete_prompt_cache[key] = prompts
+    return prompts
 
@@ -19,12 +19,13 @@ Usage:
     system_prompt, user_prompt = schema.get_llm_prompts(question, filters)
 """
 
-import json
 import os
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from functools import lru_cache
 
+import orjson
+
 
 class SemanticSchema:
     """
@@ -115,8 +116,7 @@ class SemanticSchema:
         if not path.exists():
             raise FileNotFoundError(f"Schema file not found: {path}")
         
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(path.read_bytes())
         
         return cls(data)
     
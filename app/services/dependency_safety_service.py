@@ -1,7 +1,10 @@
 """Dependency safety checks to prevent breaking changes."""
 
+from functools import lru_cache
 from typing import Optional, Any
-from sqlalchemy import select, func
+
+import orjson
+from sqlalchemy import select, func, exists, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ValidationError
@@ -13,9 +16,80 @@ from app.models.calculation import CalculatedMeasure
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _name_sets(semantic_json: bytes) -> tuple[frozenset, frozenset]:
+    """
+    Extract dimension and measure names from a serialized semantic definition.
+
+    Keyed on the sorted-key JSON encoding so identical definitions share
+    a cache entry.
+
+    Args:
+        semantic_json: orjson-encoded semantic definition (OPT_SORT_KEYS)
+
+    Returns:
+        Tuple of (dimension_names, measure_names)
+    """
+    semantic = orjson.loads(semantic_json)
+    return (
+        frozenset(d.get("name") for d in semantic.get("dimensions", [])),
+        frozenset(m.get("name") for m in semantic.get("measures", [])),
+    )
+
+
+def _semantic_name_sets(semantic: dict) -> tuple[frozenset, frozenset]:
+    """Return cached (dimension_names, measure_names) for a semantic definition."""
+    return _name_sets(orjson.dumps(semantic, option=orjson.OPT_SORT_KEYS))
+
+
 class DependencySafetyService:
     """Service for checking dependencies before destructive operations."""
 
+    @staticmethod
+    def _usage_info(
+        dataset_id: str, dataset_name: str, dashboard_count: int, measure_count: int
+    ) -> dict[str, Any]:
+        """Build the usage dictionary returned for a dataset."""
+        return {
+            "dataset_id": dataset_id,
+            "dataset_name": dataset_name,
+            "used_in_dashboards": dashboard_count,
+            "used_in_calculations": measure_count,
+            "can_delete": dashboard_count == 0 and measure_count == 0,
+            "warnings": [],
+        }
+
+    @staticmethod
+    async def _any_dependents(
+        session: AsyncSession, dataset_ids: list[str]
+    ) -> dict[str, tuple[str, bool]]:
+        """
+        Check whether datasets have any dependents, without counting them.
+
+        EXISTS stops at the first matching row, so this stays cheap even
+        when a dataset has many dependents.
+
+        Args:
+            session: Database session
+            dataset_ids: Dataset identifiers
+
+        Returns:
+            Dictionary mapping found dataset_id to (dataset_name, has_dependents)
+        """
+        # Dashboards are simplified - any active dashboard counts as a dependent
+        has_dependents = or_(
+            exists().where(Dashboard.is_active == True),
+            exists().where(
+                CalculatedMeasure.dataset_id == Dataset.id,
+                CalculatedMeasure.is_active == True,
+            ),
+        )
+        result = await session.execute(
+            select(Dataset.id, Dataset.name, has_dependents.label("has_dependents"))
+            .where(Dataset.id.in_(dataset_ids))
+        )
+        return {row.id: (row.name, bool(row.has_dependents)) for row in result}
+
     @staticmethod
     async def check_dataset_usage(
         session: AsyncSession, dataset_id: str
@@ -30,38 +104,79 @@ class DependencySafetyService:
         Returns:
             Dictionary with usage information
         """
-        dataset = await session.get(Dataset, dataset_id)
-        if not dataset:
-            raise ValidationError(f"Dataset {dataset_id} not found")
+        usage = await DependencySafetyService.check_dataset_usage_many(
+            session, [dataset_id]
+        )
+        return usage[dataset_id]
+
+    @staticmethod
+    async def check_dataset_usage_many(
+        session: AsyncSession, dataset_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Check dashboard and calculation usage for several datasets at once.
+
+        Runs a single query regardless of how many datasets are checked.
 
-        # Check dashboards using this dataset
-        # This is simplified - in production, parse visual_config to find dataset references
-        dashboard_count = await session.execute(
-            select(func.count(Dashboard.id)).where(
+        Args:
+            session: Database session
+            dataset_ids: Dataset identifiers
+
+        Returns:
+            Dictionary mapping dataset_id to usage information
+
+        Raises:
+            ValidationError: If any dataset is not found
+        """
+        ids = list(dict.fromkeys(dataset_ids))
+        if not ids:
+            return {}
+
+        # Dashboards are simplified - in production, parse visual_config to find dataset references
+        dashboard_count_sq = (
+            select(func.count(Dashboard.id))
+            .where(
                 Dashboard.is_active == True,
                 # TODO: Parse visual_config JSON to check for dataset_id
                 # For now, we'll check all active dashboards
             )
+            .scalar_subquery()
         )
-        dashboard_count = dashboard_count.scalar() or 0
-
-        # Check calculated measures
-        measure_count = await session.execute(
-            select(func.count(CalculatedMeasure.id)).where(
-                CalculatedMeasure.dataset_id == dataset_id,
+        measure_counts = (
+            select(
+                CalculatedMeasure.dataset_id,
+                func.count(CalculatedMeasure.id).label("measures"),
+            )
+            .where(
+                CalculatedMeasure.dataset_id.in_(ids),
                 CalculatedMeasure.is_active == True,
             )
+            .group_by(CalculatedMeasure.dataset_id)
+            .subquery()
         )
-        measure_count = measure_count.scalar() or 0
+        result = await session.execute(
+            select(
+                Dataset.id,
+                Dataset.name,
+                dashboard_count_sq.label("dashboards"),
+                func.coalesce(measure_counts.c.measures, 0).label("measures"),
+            )
+            .outerjoin(measure_counts, measure_counts.c.dataset_id == Dataset.id)
+            .where(Dataset.id.in_(ids))
+        )
+        rows = {row.id: row for row in result}
 
-        return {
-            "dataset_id": dataset_id,
-            "dataset_name": dataset.name,
-            "used_in_dashboards": dashboard_count,
-            "used_in_calculations": measure_count,
-            "can_delete": dashboard_count == 0 and measure_count == 0,
-            "warnings": [],
-        }
+        usage = {}
+        for dataset_id in ids:
+            row = rows.get(dataset_id)
+            if row is None:
+                raise ValidationError(f"Dataset {dataset_id} not found")
+
+            usage[dataset_id] = DependencySafetyService._usage_info(
+                dataset_id, row.name, row.dashboards or 0, row.measures or 0
+            )
+
+        return usage
 
     @staticmethod
     async def validate_dataset_deletion(
@@ -78,21 +193,73 @@ class DependencySafetyService:
         Returns:
             Tuple of (can_delete, error_message, usage_info)
         """
-        usage_info = await DependencySafetyService.check_dataset_usage(
-            session, dataset_id
+        results = await DependencySafetyService.validate_dataset_deletion_many(
+            session, [dataset_id], force=force
         )
+        return results[dataset_id]
+
+    @staticmethod
+    async def validate_dataset_deletion_many(
+        session: AsyncSession, dataset_ids: list[str], force: bool = False
+    ) -> dict[str, tuple[bool, Optional[str], dict[str, Any]]]:
+        """
+        Validate if several datasets can be safely deleted.
 
-        if usage_info["can_delete"] or force:
-            return True, None, usage_info
+        Args:
+            session: Database session
+            dataset_ids: Dataset identifiers
+            force: If True, allow deletion even if used
+
+        Returns:
+            Dictionary mapping dataset_id to (can_delete, error_message, usage_info)
 
-        error_msg = (
-            f"Cannot delete dataset '{usage_info['dataset_name']}'. "
-            f"It is used in {usage_info['used_in_dashboards']} dashboard(s) "
-            f"and {usage_info['used_in_calculations']} calculation(s). "
-            f"Use force=true to delete anyway."
+        Raises:
+            ValidationError: If any dataset is not found
+        """
+        if force:
+            usage = await DependencySafetyService.check_dataset_usage_many(
+                session, dataset_ids
+            )
+            return {
+                dataset_id: (True, None, usage_info)
+                for dataset_id, usage_info in usage.items()
+            }
+
+        # Fast path: only datasets that have dependents need exact counts
+        ids = list(dict.fromkeys(dataset_ids))
+        if not ids:
+            return {}
+        dependents = await DependencySafetyService._any_dependents(session, ids)
+        for dataset_id in ids:
+            if dataset_id not in dependents:
+                raise ValidationError(f"Dataset {dataset_id} not found")
+
+        blocked = [i for i in ids if dependents[i][1]]
+        usage = (
+            await DependencySafetyService.check_dataset_usage_many(session, blocked)
+            if blocked
+            else {}
         )
 
-        return False, error_msg, usage_info
+        results = {}
+        for dataset_id in ids:
+            usage_info = usage.get(dataset_id)
+            if usage_info is None:
+                usage_info = DependencySafetyService._usage_info(
+                    dataset_id, dependents[dataset_id][0], 0, 0
+                )
+                results[dataset_id] = (True, None, usage_info)
+                continue
+
+            error_msg = (
+                f"Cannot delete dataset '{usage_info['dataset_name']}'. "
+                f"It is used in {usage_info['used_in_dashboards']} dashboard(s) "
+                f"and {usage_info['used_in_calculations']} calculation(s). "
+                f"Use force=true to delete anyway."
+            )
+            results[dataset_id] = (False, error_msg, usage_info)
+
+        return results
 
     @staticmethod
     async def check_semantic_change_impact(
@@ -117,19 +284,16 @@ class DependencySafetyService:
         # This is simplified - in production, get actual current semantic
         current_semantic = {}  # TODO: Get from SemanticVersion
 
+        current_dims, current_measures = _semantic_name_sets(current_semantic)
+        new_dims, new_measures = _semantic_name_sets(new_semantic)
+
         # Compare dimensions
-        current_dims = {d.get("name") for d in current_semantic.get("dimensions", [])}
-        new_dims = {d.get("name") for d in new_semantic.get("dimensions", [])}
-        removed_dims = current_dims - new_dims
-        added_dims = new_dims - current_dims
+        removed_dims = current_dims.difference(new_dims)
+        added_dims = new_dims.difference(current_dims)
 
         # Compare measures
-        current_measures = {
-            m.get("name") for m in current_semantic.get("measures", [])
-        }
-        new_measures = {m.get("name") for m in new_semantic.get("measures", [])}
-        removed_measures = current_measures - new_measures
-        added_measures = new_measures - current_measures
+        removed_measures = current_measures.difference(new_measures)
+        added_measures = new_measures.difference(current_measures)
 
         warnings = []
         if removed_dims:
@@ -2,11 +2,14 @@
 
 import os
 import csv
+import hashlib
 from typing import Optional, Any
 from datetime import datetime
 from pathlib import Path
 
-from sqlalchemy import select
+import anyio
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -22,7 +25,7 @@ class FileUploadService:
     """Service for managing file uploads."""
 
     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100 MB
-    ALLOWED_EXTENSIONS = {".csv", ".xlsx", ".xls"}
+    ALLOWED_EXTENSIONS = frozenset((".csv", ".xlsx", ".xls"))
     UPLOAD_DIR = Path("uploads")
 
     @staticmethod
@@ -40,6 +43,22 @@ class FileUploadService:
         project_dir.mkdir(parents=True, exist_ok=True)
         return project_dir
 
+    @staticmethod
+    def _split_extension(filename: str) -> tuple[str, str]:
+        """
+        Split a filename into stem and lowercased extension.
+
+        Args:
+            filename: Original filename
+
+        Returns:
+            Tuple of (stem, extension); extension is "" when there is none
+        """
+        dot = filename.rfind(".")
+        if dot <= 0:
+            return filename, ""
+        return filename[:dot], filename[dot:].lower()
+
     @staticmethod
     def validate_file(filename: str, file_size: int) -> tuple[bool, Optional[str]]:
         """
@@ -60,15 +79,46 @@ class FileUploadService:
             )
 
         # Check extension
-        file_ext = Path(filename).suffix.lower()
+        _, file_ext = FileUploadService._split_extension(filename)
         if file_ext not in FileUploadService.ALLOWED_EXTENSIONS:
             return (
                 False,
-                f"File type not allowed. Allowed types: {', '.join(FileUploadService.ALLOWED_EXTENSIONS)}",
+                f"File type not allowed. Allowed types: {', '.join(sorted(FileUploadService.ALLOWED_EXTENSIONS))}",
             )
 
         return True, None
 
+    @staticmethod
+    def _hash_content(file_content: bytes) -> str:
+        """
+        Compute the content hash used to deduplicate uploads.
+
+        Args:
+            file_content: File content as bytes
+
+        Returns:
+            Hex-encoded SHA-256 digest
+        """
+        return hashlib.sha256(file_content).hexdigest()
+
+    @staticmethod
+    def _count_csv(file_path: Path) -> tuple[int, int]:
+        """
+        Count data rows and columns of a CSV file without loading it.
+
+        Args:
+            file_path: Path to CSV file
+
+        Returns:
+            Tuple of (row_count, column_count), excluding the header row
+        """
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return 0, 0
+            return sum(1 for _ in reader), len(header)
+
     @staticmethod
     async def save_uploaded_file(
         session: AsyncSession,
@@ -103,18 +153,31 @@ class FileUploadService:
         if not is_valid:
             raise ValidationError(error)
 
+        # Reuse the existing record if identical content was already uploaded
+        content_hash = await anyio.to_thread.run_sync(
+            FileUploadService._hash_content, file_content
+        )
+        existing = await FileUploadService._find_by_hash(
+            session, project_id, content_hash
+        )
+        if existing:
+            logger.info(
+                f"Skipped duplicate upload: {filename} matches file {existing.id} "
+                f"in project {project_id}"
+            )
+            return existing
+
         # Ensure upload directory
         upload_dir = FileUploadService._ensure_upload_dir(project_id)
 
         # Generate unique filename
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        file_ext = Path(filename).suffix.lower()
-        unique_filename = f"{timestamp}_{Path(filename).stem}{file_ext}"
+        stem, file_ext = FileUploadService._split_extension(filename)
+        unique_filename = f"{timestamp}_{stem}{file_ext}"
         file_path = upload_dir / unique_filename
 
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        # Save file off the event loop
+        await anyio.to_thread.run_sync(file_path.write_bytes, file_content)
 
         # Determine file type
         file_type = "csv" if file_ext == ".csv" else "xlsx"
@@ -124,11 +187,9 @@ class FileUploadService:
         column_count = None
         if file_type == "csv":
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    reader = csv.reader(f)
-                    rows = list(reader)
-                    row_count = len(rows) - 1 if len(rows) > 1 else 0  # Exclude header
-                    column_count = len(rows[0]) if rows else 0
+                row_count, column_count = await anyio.to_thread.run_sync(
+                    FileUploadService._count_csv, file_path
+                )
             except Exception as e:
                 logger.warning(f"Could not count CSV rows: {e}")
 
@@ -140,16 +201,49 @@ class FileUploadService:
             file_path=str(file_path),
             file_size=len(file_content),
             file_type=file_type,
+            content_hash=content_hash,
             row_count=row_count,
             column_count=column_count,
             created_by=created_by,
         )
 
-        session.add(uploaded_file)
-        await session.flush()
+        # A concurrent identical upload can commit between the check above and
+        # this insert; the savepoint keeps the session usable if it loses
+        try:
+            async with session.begin_nested():
+                session.add(uploaded_file)
+        except IntegrityError:
+            existing = await FileUploadService._find_by_hash(
+                session, project_id, content_hash
+            )
+            if existing is None:
+                raise
+            if existing.file_path != str(file_path):
+                await anyio.to_thread.run_sync(
+                    lambda: file_path.unlink(missing_ok=True)
+                )
+            logger.info(
+                f"Concurrent duplicate upload: {filename} resolved to file "
+                f"{existing.id} in project {project_id}"
+            )
+            return existing
+
         logger.info(f"Saved uploaded file: {filename} for project {project_id}")
         return uploaded_file
 
+    @staticmethod
+    async def _find_by_hash(
+        session: AsyncSession, project_id: int, content_hash: str
+    ) -> Optional[UploadedFile]:
+        """Return the project's upload with this content hash, if any."""
+        result = await session.execute(
+            select(UploadedFile).where(
+                UploadedFile.project_id == project_id,
+                UploadedFile.content_hash == content_hash,
+            )
+        )
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_uploaded_file(
         session: AsyncSession, file_id: int
@@ -168,14 +262,16 @@ class FileUploadService:
 
     @staticmethod
     async def list_uploaded_files(
-        session: AsyncSession, project_id: int
+        session: AsyncSession, project_id: int, skip: int = 0, limit: int = 100
     ) -> list[UploadedFile]:
         """
-        List uploaded files for a project.
+        List a page of uploaded files for a project.
 
         Args:
             session: Database session
             project_id: Project identifier
+            skip: Number of records to skip
+            limit: Maximum number of records
 
         Returns:
             List of uploaded files
@@ -184,6 +280,8 @@ class FileUploadService:
             select(UploadedFile)
             .where(UploadedFile.project_id == project_id)
             .order_by(UploadedFile.created_at.desc())
+            .offset(skip)
+            .limit(limit)
         )
         return list(result.scalars().all())
 
@@ -202,14 +300,17 @@ class FileUploadService:
         Returns:
             Updated UploadedFile
         """
-        uploaded_file = await FileUploadService.get_uploaded_file(session, file_id)
+        result = await session.execute(
+            update(UploadedFile)
+            .where(UploadedFile.id == file_id)
+            .values(is_processed=True, dataset_id=dataset_id)
+            .returning(UploadedFile)
+            .execution_options(populate_existing=True)
+        )
+        uploaded_file = result.scalar_one_or_none()
         if not uploaded_file:
             raise ValidationError(f"Uploaded file {file_id} not found")
 
-        uploaded_file.is_processed = True
-        uploaded_file.dataset_id = dataset_id
-
-        await session.flush()
         return uploaded_file
 
 
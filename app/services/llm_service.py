@@ -18,12 +18,23 @@ Usage:
 """
 
 import os
-from typing import Optional, Dict, List, Any, Tuple
-from dataclasses import dataclass
+import re
+import time
+import random
+import threading
+import asyncio
+import hashlib
+from collections import Counter, OrderedDict
+from contextlib import aclosing
+from typing import Optional, Dict, List, Any, Tuple, AsyncIterator, Awaitable, Callable, TypeVar
+from dataclasses import dataclass, replace
 from enum import Enum
 
+import orjson
+
+import httpx
 from openai import AsyncOpenAI
-from openai import OpenAIError, APIError, RateLimitError, APIConnectionError
+from openai import OpenAIError, APIError, RateLimitError, APIConnectionError, InternalServerError
 
 from app.core.logging_config import get_logger
 from app.semantic.llm_prompts import (
@@ -35,6 +46,11 @@ from app.semantic.llm_prompts import (
 
 logger = get_logger(__name__)
 
+# Patterns used to clean LLM SQL output, compiled once
+_SQL_EXTRACT_RE = re.compile(r"(SELECT\s+.*?)(?:;|$)", re.IGNORECASE | re.DOTALL)
+
+_T = TypeVar("_T")
+
 
 # =============================================================================
 # Configuration
@@ -48,7 +64,7 @@ class LLMModel(Enum):
     GPT_35_TURBO = "gpt-3.5-turbo"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """Configuration for LLM service."""
     api_key: str
@@ -57,10 +73,25 @@ class LLMConfig:
     max_tokens_sql: int = 500  # SQL queries are short
     max_tokens_answer: int = 500  # Answers should be concise
     timeout: float = 30.0  # Request timeout in seconds
-    max_retries: int = 2
+    max_retries: int = 2  # Retries with backoff on rate limit/connection/5xx errors
+    max_concurrent: int = 32  # Concurrent in-flight completion requests
+    backoff_base: float = 0.5  # Seconds; doubled per retry
+    backoff_cap: float = 8.0  # Maximum backoff before jitter
+    max_connections: int = 1000  # HTTP connection pool size
+    max_keepalive_connections: int = 200
+    http2: bool = False  # Requires the h2 package (pip install "httpx[http2]")
+    use_aiohttp: bool = False  # Send chat completions over aiohttp (see requirements.txt)
+    base_url: str = "https://api.openai.com/v1"
+    sql_cache_size: int = 512  # Cached SQL responses (0 disables caching)
+    sql_cache_ttl: float = 3600.0  # Seconds a cached SQL response stays valid
+
 
+# GPT-4o-mini pricing: $0.15/1M input, $0.60/1M output
+_PROMPT_RATE = 0.15 / 1_000_000
+_COMPLETION_RATE = 0.60 / 1_000_000
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMResponse:
     """Response from LLM."""
     content: str
@@ -74,10 +105,87 @@ class LLMResponse:
     @property
     def cost_estimate(self) -> float:
         """Estimate cost in USD (GPT-4o-mini pricing)."""
-        # GPT-4o-mini: $0.15/1M input, $0.60/1M output
-        input_cost = (self.prompt_tokens / 1_000_000) * 0.15
-        output_cost = (self.completion_tokens / 1_000_000) * 0.60
-        return input_cost + output_cost
+        return (
+            self.prompt_tokens * _PROMPT_RATE
+            + self.completion_tokens * _COMPLETION_RATE
+        )
+
+
+# =============================================================================
+# Shared Client
+# =============================================================================
+
+# One AsyncOpenAI client (and its httpx connection pool) per distinct
+# configuration, so TLS/DNS setup is paid once rather than per service.
+_clients: Dict[Tuple, AsyncOpenAI] = {}
+
+
+def _get_client(config: LLMConfig) -> AsyncOpenAI:
+    """Get the shared AsyncOpenAI client for the given configuration."""
+    key = (
+        config.api_key,
+        config.timeout,
+        config.max_retries,
+        config.max_connections,
+        config.max_keepalive_connections,
+        config.http2,
+    )
+    client = _clients.get(key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=config.api_key,
+            timeout=config.timeout,
+            # Retries are done by LLMService with a concurrency cap and jittered backoff
+            max_retries=0,
+            http_client=httpx.AsyncClient(
+                timeout=config.timeout,
+                limits=httpx.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_keepalive_connections,
+                ),
+                http2=config.http2,
+            ),
+        )
+        _clients[key] = client
+    return client
+
+
+# Shared aiohttp session, only created when LLMConfig.use_aiohttp is set
+_aiohttp_session = None
+
+
+def _get_aiohttp_session():
+    """Get the shared aiohttp session, creating it on first use."""
+    global _aiohttp_session
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        import aiohttp
+        
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=500, ttl_dns_cache=300),
+        )
+    return _aiohttp_session
+
+
+class _RetryableStatus(Exception):
+    """A 429/5xx response from the aiohttp transport, retried like OpenAI's errors."""
+    
+    def __init__(self, status: int, body: bytes, retry_after: Optional[str]):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+async def close_llm_service() -> None:
+    """Drop the singleton service and close all shared clients and pools."""
+    global _llm_service, _aiohttp_session
+    _llm_service = None
+    while _clients:
+        _, client = _clients.popitem()
+        await client.close()
+    if _aiohttp_session is not None:
+        await _aiohttp_session.close()
+        _aiohttp_session = None
 
 
 # =============================================================================
@@ -114,18 +222,35 @@ class LLMService:
             self.config = LLMConfig(
                 api_key=api_key,
                 model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+                use_aiohttp=os.getenv("OPENAI_TRANSPORT", "").lower() == "aiohttp",
+                base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
             )
         
-        # Initialize async client
-        self.client = AsyncOpenAI(
-            api_key=self.config.api_key,
-            timeout=self.config.timeout,
-            max_retries=self.config.max_retries,
-        )
+        # Check the optional transport now, so a misconfigured worker fails at
+        # startup (init_llm_service) rather than on its first request
+        if self.config.use_aiohttp:
+            try:
+                import aiohttp  # noqa: F401
+            except ImportError as e:
+                raise RuntimeError(
+                    "OPENAI_TRANSPORT=aiohttp requires the aiohttp package (pip install aiohttp)"
+                ) from e
+        
+        # Reuse the shared async client for this configuration
+        self.client = _get_client(self.config)
+        
+        # Exact-match cache of generated SQL: key -> (expires_at, response)
+        self._sql_cache: OrderedDict[str, Tuple[float, LLMResponse]] = OrderedDict()
+        
+        # In-flight completions shared by concurrent identical requests
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # Caps concurrent API requests to stay within provider rate limits
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrent)
         
         # Track usage
-        self.total_tokens_used = 0
-        self.total_requests = 0
+        # Usage counters: "tokens", "requests", "cache_hits"
+        self._usage: Counter = Counter()
         
         logger.info(f"LLMService initialized with model: {self.config.model}")
     
@@ -152,6 +277,12 @@ class LLMService:
         """
         logger.info(f"Generating SQL for: {question[:100]}...")
         
+        cache_key = self._sql_cache_key(question, filters, include_examples)
+        cached = self._get_cached_sql(cache_key)
+        if cached is not None:
+            logger.info("SQL served from cache")
+            return cached
+        
         # Build prompts using semantic layer
         system_prompt, user_prompt = build_complete_prompt(
             question=question,
@@ -171,12 +302,239 @@ class LLMService:
             # Clean up the SQL response
             sql = self._clean_sql_response(response.content)
             response.content = sql
+            self._store_cached_sql(cache_key, response)
             logger.info(f"SQL generated successfully: {sql[:100]}...")
         else:
             logger.error(f"SQL generation failed: {response.error}")
         
         return response
     
+    async def generate_sql_stream(
+        self,
+        question: str,
+        filters: Optional[Dict] = None,
+        include_examples: int = 5,
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated SQL text as the model produces it.
+        
+        Stops reading as soon as a fenced code block closes, releasing the
+        connection without waiting for trailing explanation text. The
+        concatenated chunks can be passed through _clean_sql_response.
+        
+        Args:
+            question: User's natural language question
+            filters: Current dashboard filters (optional)
+            include_examples: Number of few-shot examples to include
+            
+        Yields:
+            Raw content deltas
+        """
+        system_prompt, user_prompt = build_complete_prompt(
+            question=question,
+            filters=filters,
+            include_examples=include_examples,
+        )
+        
+        content = ""
+        deltas = self._call_llm_stream(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=self.config.max_tokens_sql,
+            temperature=0.1,
+        )
+        async with aclosing(deltas):
+            async for delta in deltas:
+                yield delta
+                content += delta
+                # Opening fence plus a closing fence means the SQL is complete
+                if content.lstrip().startswith("```") and content.count("```") >= 2:
+                    break
+    
+    async def generate_sql_many(
+        self,
+        questions: List[str],
+        filters: Optional[Dict] = None,
+        include_examples: int = 5,
+    ) -> List[LLMResponse]:
+        """
+        Generate SQL for several questions concurrently (interactive path).
+        
+        Args:
+            questions: Natural language questions
+            filters: Dashboard filters applied to every question
+            include_examples: Number of few-shot examples to include
+            
+        Returns:
+            LLMResponses in the same order as questions
+        """
+        return list(await asyncio.gather(*(
+            self.generate_sql(question, filters, include_examples)
+            for question in questions
+        )))
+    
+    async def batch_generate_sql(
+        self,
+        questions: List[str],
+        filters: Optional[Dict] = None,
+        include_examples: int = 5,
+        poll_interval: float = 30.0,
+    ) -> List[LLMResponse]:
+        """
+        Generate SQL for many questions through the OpenAI Batch API.
+        
+        For non-interactive work (e.g. scheduled tile refreshes): batch
+        requests are billed at half price but may take up to 24 hours, so
+        use generate_sql_many for anything a user is waiting on.
+        
+        Args:
+            questions: Natural language questions
+            filters: Dashboard filters applied to every question
+            include_examples: Number of few-shot examples to include
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            LLMResponses in the same order as questions
+        """
+        if not questions:
+            return []
+        
+        lines = []
+        for i, question in enumerate(questions):
+            system_prompt, user_prompt = build_complete_prompt(
+                question=question,
+                filters=filters,
+                include_examples=include_examples,
+            )
+            lines.append(orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.config.model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    "max_tokens": self.config.max_tokens_sql,
+                    "temperature": 0.1,
+                },
+            }))
+        
+        responses = [
+            self._failed_response("SQL generation did not complete in batch.")
+            for _ in questions
+        ]
+        
+        # Batch endpoints are not rate-limited like completions; use client retries
+        client = self.client.with_options(max_retries=self.config.max_retries)
+        try:
+            batch_file = await client.files.create(
+                file=("sql_batch.jsonl", b"\n".join(lines)),
+                purpose="batch",
+            )
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info(f"Submitted SQL batch {batch.id} with {len(questions)} questions")
+            
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error(f"SQL batch {batch.id} ended with status {batch.status}")
+                return responses
+            
+            output = await client.files.content(batch.output_file_id)
+        except OpenAIError as e:
+            logger.error(f"Batch API error: {e}")
+            return [
+                self._failed_response(f"AI service error: {str(e)}")
+                for _ in questions
+            ]
+        
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            row = orjson.loads(line)
+            result = row.get("response") or {}
+            if result.get("status_code") != 200:
+                continue
+            
+            body = result["body"]
+            usage = body.get("usage") or {}
+            total_tokens = usage.get("total_tokens", 0)
+            self._record_usage(total_tokens)
+            responses[int(row["custom_id"])] = LLMResponse(
+                content=self._clean_sql_response(
+                    body["choices"][0]["message"].get("content") or ""
+                ),
+                model=body.get("model", self.config.model),
+                prompt_tokens=usage.get("prompt_tokens", 0),
+                completion_tokens=usage.get("completion_tokens", 0),
+                total_tokens=total_tokens,
+                success=True,
+            )
+        
+        return responses
+    
+    def _sql_cache_key(
+        self, question: str, filters: Optional[Dict], include_examples: int
+    ) -> str:
+        """Build the cache key from the normalized question, filters and prompt shape."""
+        normalized = " ".join(question.lower().split())
+        payload = orjson.dumps(
+            [self.config.model, include_examples, normalized, filters or {}],
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return hashlib.sha256(payload).hexdigest()
+    
+    def _get_cached_sql(self, key: str) -> Optional[LLMResponse]:
+        """Return a zero-cost copy of a cached SQL response, or None on miss."""
+        entry = self._sql_cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._sql_cache[key]
+            return None
+        
+        self._sql_cache.move_to_end(key)
+        self._usage.update(cache_hits=1)
+        # No tokens are spent on a cache hit
+        return replace(response, prompt_tokens=0, completion_tokens=0, total_tokens=0)
+    
+    def _store_cached_sql(self, key: str, response: LLMResponse) -> None:
+        """Cache a successful SQL response, evicting the least recently used entry."""
+        if self.config.sql_cache_size <= 0:
+            return
+        
+        self._sql_cache[key] = (time.monotonic() + self.config.sql_cache_ttl, replace(response))
+        self._sql_cache.move_to_end(key)
+        while len(self._sql_cache) > self.config.sql_cache_size:
+            self._sql_cache.popitem(last=False)
+    
+    async def aclose(self):
+        """
+        Release this service's own state.
+        
+        The API client is shared with every service of the same
+        configuration, so it stays open; close_llm_service closes it.
+        """
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        self._sql_cache.clear()
+    
+    def clear_cache(self):
+        """Drop all cached SQL responses (e.g. after a semantic layer change)."""
+        self._sql_cache.clear()
+    
     # =========================================================================
     # Answer Formatting
     # =========================================================================
@@ -254,9 +612,8 @@ If no results, explain what that means."""
         
         if response.success:
             try:
-                import json
-                return json.loads(response.content)
-            except json.JSONDecodeError:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 return {"intent": "other", "is_answerable": True}
         
         return {"intent": "other", "is_answerable": True}
@@ -275,6 +632,9 @@ If no results, explain what that means."""
         """
         Make API call to OpenAI.
         
+        Concurrent calls with identical prompts and parameters share a
+        single API request.
+        
         Args:
             system_prompt: System message
             user_prompt: User message
@@ -284,8 +644,39 @@ If no results, explain what that means."""
         Returns:
             LLMResponse object
         """
+        key = hashlib.sha1(
+            orjson.dumps([system_prompt, user_prompt, max_tokens, temperature])
+        ).hexdigest()
+        
+        task = self._inflight.get(key)
+        if task is not None:
+            # Piggyback on the identical in-flight call; tokens were spent once
+            response = await asyncio.shield(task)
+            return replace(response, prompt_tokens=0, completion_tokens=0, total_tokens=0)
+        
+        task = asyncio.ensure_future(
+            self._request_completion(system_prompt, user_prompt, max_tokens, temperature)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a cancelled caller does not fail the others waiting on it
+        return await asyncio.shield(task)
+    
+    async def _request_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> LLMResponse:
+        """Send one chat completion request (no deduplication)."""
+        if self.config.use_aiohttp:
+            return await self._aiohttp_call_llm(
+                system_prompt, user_prompt, max_tokens, temperature
+            )
+        
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.config.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -300,8 +691,7 @@ If no results, explain what that means."""
             usage = response.usage
             
             # Update tracking
-            self.total_tokens_used += usage.total_tokens
-            self.total_requests += 1
+            self._record_usage(usage.total_tokens)
             
             logger.debug(
                 f"LLM call successful. Tokens: {usage.total_tokens} "
@@ -365,36 +755,214 @@ If no results, explain what that means."""
                 error="An unexpected error occurred. Please try again.",
             )
     
-    def _clean_sql_response(self, content: str) -> str:
+    async def _create_completion(self, **kwargs: Any) -> Any:
         """
-        Clean up LLM-generated SQL response.
+        Create a chat completion with bounded concurrency and retries.
         
-        Removes markdown code blocks, extra whitespace, etc.
+        Raises:
+            OpenAIError: The last error once retries are exhausted
         """
-        sql = content.strip()
+        return await self._with_retries(
+            lambda: self.client.chat.completions.create(**kwargs),
+            (RateLimitError, APIConnectionError, InternalServerError),
+        )
+    
+    async def _with_retries(
+        self,
+        send: Callable[[], Awaitable[_T]],
+        retryable: Tuple[type, ...],
+    ) -> _T:
+        """
+        Run one API request under the concurrency cap, retrying transient errors.
         
-        # Remove markdown code blocks
-        if sql.startswith("```sql"):
-            sql = sql[6:]
-        elif sql.startswith("```"):
-            sql = sql[3:]
+        Errors in ``retryable`` are retried up to config.max_retries times
+        with exponential backoff plus jitter, honoring Retry-After when the
+        API sends it. The semaphore is not held while backing off.
         
-        if sql.endswith("```"):
-            sql = sql[:-3]
+        Args:
+            send: Factory for a fresh request coroutine per attempt
+            retryable: Exception types worth retrying
+            
+        Raises:
+            Exception: The last retryable error once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    return await send()
+            except retryable as e:
+                if attempt >= self.config.max_retries:
+                    raise
+                
+                delay = min(self.config.backoff_cap, self.config.backoff_base * 2 ** attempt)
+                retry_after = getattr(e, "retry_after", None)
+                response = getattr(e, "response", None)
+                if retry_after is None and response is not None:
+                    retry_after = response.headers.get("retry-after")
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                delay += random.uniform(0, self.config.backoff_base)
+                
+                attempt += 1
+                logger.warning(
+                    f"{type(e).__name__} from LLM API, retry {attempt}/"
+                    f"{self.config.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+    
+    async def _call_llm_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncIterator[str]:
+        """
+        Make a streaming API call to OpenAI, yielding content deltas.
         
-        # Clean up whitespace
-        sql = sql.strip()
+        The underlying HTTP response is closed when the caller stops
+        iterating, returning the connection to the pool.
+        """
+        stream = await self._create_completion(
+            model=self.config.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        self._usage.update(requests=1)
+        
+        try:
+            async for chunk in stream:
+                if chunk.usage:
+                    self._usage.update(tokens=chunk.usage.total_tokens)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.close()
+    
+    def _failed_response(self, error: str) -> LLMResponse:
+        """Build an unsuccessful LLMResponse carrying a user-facing error."""
+        return LLMResponse(
+            content="",
+            model=self.config.model,
+            prompt_tokens=0,
+            completion_tokens=0,
+            total_tokens=0,
+            success=False,
+            error=error,
+        )
+    
+    async def _aiohttp_call_llm(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> LLMResponse:
+        """
+        Make the chat completions call directly over aiohttp.
+        
+        Same contract as _call_llm; avoids httpx pool contention under high
+        concurrency. Shares the concurrency cap and retry policy of the
+        OpenAI client path.
+        """
+        import aiohttp
+        
+        failed = self._failed_response
+        payload = orjson.dumps({
+            "model": self.config.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        })
+        
+        async def send() -> Tuple[int, bytes]:
+            async with _get_aiohttp_session().post(
+                f"{self.config.base_url}/chat/completions",
+                headers={"Authorization": f"Bearer {self.config.api_key}"},
+                data=payload,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            ) as resp:
+                body = await resp.read()
+                if resp.status == 429 or resp.status >= 500:
+                    raise _RetryableStatus(resp.status, body, resp.headers.get("Retry-After"))
+                return resp.status, body
+        
+        try:
+            status, body = await self._with_retries(
+                send, (_RetryableStatus, aiohttp.ClientConnectionError, TimeoutError)
+            )
+            
+            if status >= 400:
+                logger.error(f"API error {status}: {body[:200]!r}")
+                return failed(f"AI service error: HTTP {status}")
+            
+            data = orjson.loads(body)
+            content = data["choices"][0]["message"].get("content") or ""
+            usage = data.get("usage") or {}
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+            total_tokens = usage.get("total_tokens", prompt_tokens + completion_tokens)
+            
+            # Update tracking
+            self._record_usage(total_tokens)
+            
+            return LLMResponse(
+                content=content,
+                model=data.get("model", self.config.model),
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=total_tokens,
+                success=True,
+            )
+            
+        except _RetryableStatus as e:
+            if e.status == 429:
+                logger.error(f"Rate limit error: {e.body[:200]!r}")
+                return failed("Rate limit exceeded. Please try again in a moment.")
+            logger.error(f"API error {e.status}: {e.body[:200]!r}")
+            return failed(f"AI service error: HTTP {e.status}")
+            
+        except (aiohttp.ClientConnectionError, TimeoutError) as e:
+            logger.error(f"Connection error: {e}")
+            return failed("Unable to connect to AI service. Please check your connection.")
+            
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}", exc_info=True)
+            return failed("An unexpected error occurred. Please try again.")
+    
+    def _clean_sql_response(self, content: str) -> str:
+        """
+        Clean up LLM-generated SQL response.
+        
+        Removes markdown code blocks, extra whitespace, etc.
+        """
+        # Remove markdown code blocks and surrounding whitespace
+        sql = (
+            content.strip()
+            .removeprefix("```sql")
+            .removeprefix("```")
+            .removesuffix("```")
+            .strip()
+        )
         
         # Remove any explanation text (keep only SQL)
         # If there's text after the SQL, try to extract just the query
         if "SELECT" in sql.upper():
             # Find the SQL query
-            import re
-            match = re.search(
-                r'(SELECT\s+.*?)(?:;|$)', 
-                sql, 
-                re.IGNORECASE | re.DOTALL
-            )
+            match = _SQL_EXTRACT_RE.search(sql)
             if match:
                 sql = match.group(1).strip()
         
@@ -404,19 +972,37 @@ If no results, explain what that means."""
     # Utility Methods
     # =========================================================================
     
+    def _record_usage(self, tokens: int) -> None:
+        """Count one completed request and the tokens it used."""
+        self._usage.update({"tokens": tokens, "requests": 1})
+    
+    @property
+    def total_tokens_used(self) -> int:
+        return self._usage["tokens"]
+    
+    @property
+    def total_requests(self) -> int:
+        return self._usage["requests"]
+    
+    @property
+    def cache_hits(self) -> int:
+        return self._usage["cache_hits"]
+    
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics."""
+        usage = self._usage.copy()
         return {
-            "total_requests": self.total_requests,
-            "total_tokens": self.total_tokens_used,
-            "estimated_cost_usd": (self.total_tokens_used / 1_000_000) * 0.375,  # Avg of input/output
+            "total_requests": usage["requests"],
+            "total_tokens": usage["tokens"],
+            "cache_hits": usage["cache_hits"],
+            "cached_sql_responses": len(self._sql_cache),
+            "estimated_cost_usd": (usage["tokens"] / 1_000_000) * 0.375,  # Avg of input/output
             "model": self.config.model,
         }
     
     def reset_usage_stats(self):
         """Reset usage tracking."""
-        self.total_tokens_used = 0
-        self.total_requests = 0
+        self._usage.clear()
     
     async def health_check(self) -> bool:
         """Check if LLM service is operational."""
@@ -437,16 +1023,35 @@ If no results, explain what that means."""
 # =============================================================================
 
 _llm_service: Optional[LLMService] = None
+_llm_service_lock = threading.Lock()
 
 
 def get_llm_service() -> LLMService:
     """Get the singleton LLM service instance."""
     global _llm_service
     if _llm_service is None:
-        _llm_service = LLMService()
+        with _llm_service_lock:
+            if _llm_service is None:
+                _llm_service = LLMService()
     return _llm_service
 
 
+def init_llm_service() -> Optional[LLMService]:
+    """
+    Create the singleton LLM service at application startup.
+    
+    Returns None (and leaves lazy creation to get_llm_service) when the
+    service is not configured, so the app can still start without an
+    OpenAI API key. A configured transport whose package is missing raises,
+    failing startup.
+    """
+    try:
+        return get_llm_service()
+    except ValueError as e:
+        logger.warning(f"LLM service not initialized: {e}")
+        return None
+
+
 async def generate_sql(question: str, filters: Optional[Dict] = None) -> str:
     """
     Quick function to generate SQL from a question.
@@ -1,9 +1,9 @@
 """Project service for workspace management."""
 
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ValidationError
@@ -63,15 +63,20 @@ class ProjectService:
         skip: int = 0,
         limit: int = 100,
         user_id: Optional[str] = None,
+        cursor: Optional[tuple[datetime, int]] = None,
     ) -> list[Project]:
         """
-        List all active projects.
+        List all active projects, most recently updated first.
+
+        Pass the (updated_at, id) of the last project of the previous page
+        as cursor for keyset pagination; skip is ignored in that case.
 
         Args:
             session: Database session
-            skip: Number of records to skip
+            skip: Number of records to skip (offset pagination)
             limit: Maximum number of records
             user_id: Optional user ID to filter by
+            cursor: Optional (updated_at, id) to continue after
 
         Returns:
             List of projects
@@ -81,8 +86,23 @@ class ProjectService:
         if user_id:
             query = query.where(Project.created_by == user_id)
 
+        if cursor:
+            # updated_at is stored as naive UTC; bind the cursor the same way so
+            # the cursor row itself never compares as "older"
+            cursor_updated_at, cursor_id = cursor
+            if cursor_updated_at.tzinfo is not None:
+                cursor_updated_at = cursor_updated_at.astimezone(timezone.utc).replace(
+                    tzinfo=None
+                )
+            query = query.where(
+                tuple_(Project.updated_at, Project.id)
+                < tuple_(cursor_updated_at, cursor_id)
+            )
+        else:
+            query = query.offset(skip)
+
         result = await session.execute(
-            query.offset(skip).limit(limit).order_by(Project.updated_at.desc())
+            query.order_by(Project.updated_at.desc(), Project.id.desc()).limit(limit)
         )
         return list(result.scalars().all())
 
@@ -156,7 +176,6 @@ class ProjectService:
             project.description = description
 
         project.updated_by = updated_by
-        project.updated_at = datetime.utcnow()
 
         await session.flush()
         logger.info(f"Updated project: {project_id}")
@@ -183,7 +202,6 @@ class ProjectService:
         project = await ProjectService.get_project_or_raise(session, project_id)
         project.is_active = False
         project.updated_by = updated_by
-        project.updated_at = datetime.utcnow()
 
         await session.flush()
         logger.info(f"Deleted project: {project_id}")
@@ -1,17 +1,103 @@
 """Query engine for generating and executing SQL queries."""
 
+import re
 from typing import Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
-from sqlalchemy import text
+import orjson
+from cachetools import TTLCache
+from sqlalchemy import Date, DateTime, text, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache_generation
 from app.core.exceptions import QueryExecutionError, ValidationError
 from app.core.logging_config import get_logger
 from app.services.semantic_service import SemanticService
 
 logger = get_logger(__name__)
 
+# Results of opted-in report queries keyed on (normalized SQL, bind parameters),
+# stored with the cache generation they were loaded under; any list-cache
+# invalidation (including other workers' writes via NOTIFY) retires them
+_result_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+# Comparison operators a filter may use; anything else is rejected
+_FILTER_OPERATORS = frozenset(("=", "!=", "IN", ">", "<", ">=", "<="))
+
+# Filter and time columns are interpolated into SQL, so they must be bare identifiers
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Semantic field types whose filter values are bound as dates/timestamps
+_TEMPORAL_TYPES = frozenset(("date", "datetime", "timestamp"))
+
+
+@lru_cache(maxsize=2048)
+def _measure_sql(column: str, aggregation: str, alias: Optional[str]) -> tuple[str, str]:
+    """
+    Render a measure's SELECT fragment.
+
+    Args:
+        column: Measure column
+        aggregation: Aggregation function
+        alias: Output alias, or None for the default "<aggregation>_<column>"
+
+    Returns:
+        Tuple of (select fragment, effective alias)
+    """
+    alias = alias or f"{aggregation}_{column}"
+    return f"{aggregation}({column}) AS {alias}", alias
+
+
+def _parse_temporal(value: Any, field: str) -> Any:
+    """
+    Parse an ISO-8601 filter value into a date or datetime.
+
+    Drivers such as asyncpg refuse to compare a string parameter with a
+    date/timestamp column, so temporal bounds are bound as Python objects.
+
+    Args:
+        value: Filter value (ISO string, date or datetime)
+        field: Field name, for the error message
+
+    Returns:
+        date for "YYYY-MM-DD" strings, datetime for longer ones
+
+    Raises:
+        ValidationError: If the value is not an ISO-8601 date or timestamp
+    """
+    if isinstance(value, date):
+        return value
+    try:
+        if isinstance(value, str) and len(value) == 10:
+            return date.fromisoformat(value)
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"Invalid date for '{field}': {value!r}")
+
+
+def _filter_field_types(semantic_schema: dict[str, Any]) -> dict[str, str]:
+    """Map every filterable name/column of a semantic schema to its field type."""
+    types: dict[str, str] = {}
+    for dim in semantic_schema.get("dimensions", []):
+        for key in (dim.get("name"), dim.get("column")):
+            types[key] = dim.get("type", "string")
+    for measure in semantic_schema.get("measures", []):
+        for key in (measure.get("name"), measure.get("column")):
+            types[key] = measure.get("type", "numeric")
+    for time_column in semantic_schema.get("time_columns", []):
+        types[time_column] = "date"
+    types.pop(None, None)
+    return types
+
+
+def _check_column(column: Any, field_types: Optional[dict[str, str]], kind: str) -> None:
+    """Reject filter columns that are not identifiers or not in the semantic schema."""
+    if not isinstance(column, str) or not _IDENTIFIER_RE.fullmatch(column):
+        raise ValidationError(f"Invalid {kind} column: {column!r}")
+    if field_types is not None and column not in field_types:
+        raise ValidationError(f"Unknown {kind} column: {column}")
+
 
 class QueryEngine:
     """Engine for generating and executing analytics queries."""
@@ -26,10 +112,15 @@ class QueryEngine:
         time_filter: Optional[dict[str, Any]] = None,
         limit: Optional[int] = None,
         semantic_schema: Optional[dict[str, Any]] = None,
-    ) -> str:
+    ) -> tuple[str, dict[str, Any]]:
         """
         Build SQL query from visualization configuration.
 
+        Filter values are emitted as bind parameters (:p0, :p1, ...) rather
+        than inlined, so repeated query shapes share a server-side plan.
+        Time-filter bounds, and filter values on date fields of the semantic
+        schema, are parsed to date/datetime so they bind with a temporal type.
+
         Args:
             dataset_table: Table name
             schema_name: Schema name (optional)
@@ -41,16 +132,19 @@ class QueryEngine:
             semantic_schema: Semantic layer schema for validation
 
         Returns:
-            SQL query string
+            Tuple of (SQL query string, bind parameters)
 
         Raises:
             ValidationError: If query configuration is invalid
         """
         # Validate against semantic schema if provided
+        field_types = None
         if semantic_schema:
+            field_types = _filter_field_types(semantic_schema)
+            field_index = SemanticService.field_index(semantic_schema)
             for dim in dimensions:
                 is_valid, error = SemanticService.validate_field_usage(
-                    semantic_schema, dim, "dimension"
+                    field_index, dim, "dimension"
                 )
                 if not is_valid:
                     raise ValidationError(f"Dimension validation failed: {error}")
@@ -59,7 +153,7 @@ class QueryEngine:
                 measure_name = measure.get("name")
                 aggregation = measure.get("aggregation")
                 is_valid, error = SemanticService.validate_field_usage(
-                    semantic_schema, measure_name, "measure", aggregation
+                    field_index, measure_name, "measure", aggregation
                 )
                 if not is_valid:
                     raise ValidationError(f"Measure validation failed: {error}")
@@ -68,11 +162,15 @@ class QueryEngine:
         select_parts = []
         select_parts.extend(dimensions)
 
+        measure_aliases = []
         for measure in measures:
-            column = measure.get("column")
-            aggregation = measure.get("aggregation", "SUM")
-            alias = measure.get("alias", f"{aggregation}_{column}")
-            select_parts.append(f"{aggregation}({column}) AS {alias}")
+            fragment, alias = _measure_sql(
+                measure.get("column"),
+                measure.get("aggregation", "SUM"),
+                measure.get("alias"),
+            )
+            select_parts.append(fragment)
+            measure_aliases.append(alias)
 
         select_clause = ", ".join(select_parts)
 
@@ -84,79 +182,80 @@ class QueryEngine:
 
         # Build WHERE clause
         where_conditions = []
+        params: dict[str, Any] = {}
         if filters:
             for filter_config in filters:
                 column = filter_config.get("column")
                 operator = filter_config.get("operator", "=")
                 value = filter_config.get("value")
 
-                if operator == "=":
-                    where_conditions.append(f"{column} = '{value}'")
-                elif operator == "!=":
-                    where_conditions.append(f"{column} != '{value}'")
-                elif operator == "IN":
-                    values = ",".join([f"'{v}'" for v in value])
-                    where_conditions.append(f"{column} IN ({values})")
-                elif operator == ">":
-                    where_conditions.append(f"{column} > {value}")
-                elif operator == "<":
-                    where_conditions.append(f"{column} < {value}")
-                elif operator == ">=":
-                    where_conditions.append(f"{column} >= {value}")
-                elif operator == "<=":
-                    where_conditions.append(f"{column} <= {value}")
+                if operator not in _FILTER_OPERATORS:
+                    raise ValidationError(f"Unsupported filter operator: {operator!r}")
+                _check_column(column, field_types, "filter")
+
+                temporal = field_types is not None and field_types[column] in _TEMPORAL_TYPES
+                param = f"p{len(params)}"
+                if operator == "IN":
+                    # Bound as an expanding parameter by execute_query
+                    values = list(value)
+                    if temporal:
+                        values = [_parse_temporal(v, column) for v in values]
+                    params[param] = values
+                    where_conditions.append(f"{column} IN :{param}")
+                else:
+                    if temporal:
+                        value = _parse_temporal(value, column)
+                    params[param] = value
+                    where_conditions.append(f"{column} {operator} :{param}")
 
         if time_filter:
             time_column = time_filter.get("column")
             start_date = time_filter.get("start_date")
             end_date = time_filter.get("end_date")
 
-            if start_date and end_date:
-                where_conditions.append(
-                    f"{time_column} >= '{start_date}' AND {time_column} <= '{end_date}'"
-                )
-            elif start_date:
-                where_conditions.append(f"{time_column} >= '{start_date}'")
-            elif end_date:
-                where_conditions.append(f"{time_column} <= '{end_date}'")
+            if start_date or end_date:
+                _check_column(time_column, None, "time")
+                if semantic_schema and time_column not in semantic_schema.get("time_columns", []):
+                    raise ValidationError(f"Unknown time column: {time_column}")
+
+            if start_date:
+                params["start_date"] = _parse_temporal(start_date, "start_date")
+                where_conditions.append(f"{time_column} >= :start_date")
+            if end_date:
+                params["end_date"] = _parse_temporal(end_date, "end_date")
+                where_conditions.append(f"{time_column} <= :end_date")
 
-        where_clause = ""
+        parts = ["SELECT", select_clause, "FROM", from_clause]
+
+        # WHERE clause
         if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions)
+            parts.append("WHERE " + " AND ".join(where_conditions))
 
-        # Build GROUP BY clause
-        group_by_clause = ""
+        # GROUP BY clause
         if dimensions:
-            group_by_clause = "GROUP BY " + ", ".join(dimensions)
+            parts.append("GROUP BY " + ", ".join(dimensions))
 
-        # Build ORDER BY clause (optional)
-        order_by_clause = ""
-        if measures:
+        # ORDER BY clause (optional)
+        if measure_aliases:
             # Default order by first measure descending
-            first_measure = measures[0]
-            alias = first_measure.get("alias", f"{first_measure.get('aggregation')}_{first_measure.get('column')}")
-            order_by_clause = f"ORDER BY {alias} DESC"
+            parts.append(f"ORDER BY {measure_aliases[0]} DESC")
 
-        # Build LIMIT clause
-        limit_clause = ""
+        # LIMIT clause
         if limit:
-            limit_clause = f"LIMIT {limit}"
-
-        # Assemble query
-        query = f"""
-        SELECT {select_clause}
-        FROM {from_clause}
-        {where_clause}
-        {group_by_clause}
-        {order_by_clause}
-        {limit_clause}
-        """.strip()
+            parts.append(f"LIMIT {int(limit)}")
 
-        return query
+        # Assemble query on a single line; no whitespace cleanup needed
+        query = " ".join(parts)
+
+        return query, params
 
     @staticmethod
     async def execute_query(
-        session: AsyncSession, query: str, timeout: Optional[int] = None
+        session: AsyncSession,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        cache: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Execute a SQL query and return results.
@@ -164,7 +263,11 @@ class QueryEngine:
         Args:
             session: Database session
             query: SQL query string
+            params: Bind parameters; list values are bound as expanding (IN) parameters
             timeout: Query timeout in seconds
+            cache: Serve/store results from the short-lived result cache. Only
+                for read-only report queries that tolerate data up to 60s old
+                when tables are loaded outside the app
 
         Returns:
             List of result rows as dictionaries
@@ -172,23 +275,76 @@ class QueryEngine:
         Raises:
             QueryExecutionError: If query execution fails
         """
+        cache_key = None
+        generation = cache_generation()
+        if cache and query.lstrip()[:6].upper() in ("SELECT", "WITH"):
+            cache_key = QueryEngine._result_cache_key(query, params)
+            cached = _result_cache.get(cache_key)
+            if cached is not None and cached[0] == generation:
+                return [row.copy() for row in cached[1]]
+
         try:
-            result = await session.execute(text(query))
-            rows = result.fetchall()
+            statement = QueryEngine._prepare_statement(query, params)
+            result = await session.execute(statement, params or {})
 
-            # Convert to list of dicts
-            columns = result.keys()
-            return [dict(zip(columns, row)) for row in rows]
+            # Convert to list of plain dicts
+            results = [dict(row) for row in result.mappings()]
+
+            # Skip storing if a write was signalled while the query ran
+            if cache_key is not None and generation == cache_generation():
+                _result_cache[cache_key] = (generation, [row.copy() for row in results])
+            return results
 
         except Exception as e:
             logger.error(f"Query execution failed: {str(e)}", exc_info=True)
             raise QueryExecutionError(f"Query execution failed: {str(e)}", query=query)
 
+    @staticmethod
+    def _prepare_statement(query: str, params: Optional[dict[str, Any]]):
+        """
+        Wrap SQL in text(), typing the parameters the driver cannot infer.
+
+        List values are bound as expanding (IN) parameters, and date/datetime
+        values (or lists of them) carry a Date/DateTime type so drivers that
+        cast binds, such as asyncpg, compare them with temporal columns.
+        """
+        statement = text(query)
+        if params:
+            typed = []
+            for name, value in params.items():
+                expanding = isinstance(value, (list, tuple))
+                sample = value[0] if expanding and value else value
+                if isinstance(sample, datetime):
+                    type_ = DateTime(timezone=sample.tzinfo is not None)
+                elif isinstance(sample, date):
+                    type_ = Date()
+                else:
+                    type_ = None
+                if expanding or type_ is not None:
+                    typed.append(bindparam(name, expanding=expanding, type_=type_))
+            if typed:
+                statement = statement.bindparams(*typed)
+        return statement
+
+    @staticmethod
+    def _result_cache_key(query: str, params: Optional[dict[str, Any]]) -> tuple[str, bytes]:
+        """Build the result cache key from whitespace-normalized SQL and its parameters."""
+        normalized = " ".join(query.split())
+        return normalized, orjson.dumps(params or {}, option=orjson.OPT_SORT_KEYS, default=str)
+
+    @staticmethod
+    def clear_result_cache() -> None:
+        """Drop all cached query results (e.g. after a data load)."""
+        _result_cache.clear()
+
     @staticmethod
     def optimize_query(query: str) -> str:
         """
         Optimize query for performance.
 
+        build_query already emits normalized single-line SQL, so this is
+        only needed for hand-written queries.
+
         Args:
             query: SQL query string
 
@@ -1,9 +1,11 @@
 """Role-Based Access Control service."""
 
+from collections.abc import Iterable
 from typing import Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.exceptions import PermissionDeniedError
 from app.core.logging_config import get_logger
@@ -30,6 +32,9 @@ class RBACService:
         """
         Get all permissions for a user.
 
+        Not cached: roles and permissions can change in another process, and
+        an authorization check must never see a stale grant.
+
         Args:
             session: Database session
             user_id: User identifier
@@ -37,21 +42,49 @@ class RBACService:
         Returns:
             List of permission names
         """
+        # Project just the names; no User/Role/Permission objects are hydrated
         result = await session.execute(
-            select(User).where(User.id == user_id, User.is_active == True)
+            select(Permission.name)
+            .select_from(User)
+            .join(User.roles)
+            .join(Role.permissions)
+            .where(User.id == user_id, User.is_active.is_(True), Role.is_active.is_(True))
+            .distinct()
         )
-        user = result.scalar_one_or_none()
+        return list(result.scalars().all())
 
-        if not user:
-            return []
+    @staticmethod
+    async def get_permissions_for_users(
+        session: AsyncSession, user_ids: Iterable[str]
+    ) -> dict[str, frozenset[str]]:
+        """
+        Get permissions for many users with at most one query.
 
-        permissions = set()
-        for role in user.roles:
-            if role.is_active:
-                for perm in role.permissions:
-                    permissions.add(perm.name)
+        Unknown or inactive users map to an empty set.
 
-        return list(permissions)
+        Args:
+            session: Database session
+            user_ids: User identifiers
+
+        Returns:
+            Dictionary of user id to permission names
+        """
+        wanted = set(user_ids)
+        if not wanted:
+            return {}
+
+        result = await session.execute(
+            select(User.id, Permission.name)
+            .join(User.roles)
+            .join(Role.permissions)
+            .where(User.id.in_(wanted), User.is_active.is_(True), Role.is_active.is_(True))
+            .distinct()
+        )
+        fetched: dict[str, set[str]] = {user_id: set() for user_id in wanted}
+        for user_id, name in result.all():
+            fetched[user_id].add(name)
+
+        return {user_id: frozenset(names) for user_id, names in fetched.items()}
 
     @staticmethod
     async def check_permission(
@@ -107,7 +140,9 @@ class RBACService:
             Role name or None
         """
         result = await session.execute(
-            select(User).where(User.id == user_id, User.is_active == True)
+            select(User)
+            .options(selectinload(User.roles))
+            .where(User.id == user_id, User.is_active.is_(True))
         )
         user = result.scalar_one_or_none()
 
@@ -142,8 +177,10 @@ class RBACService:
         Returns:
             True if access allowed
         """
+        permissions = await RBACService.get_user_permissions(session, user_id)
+
         # Admin can do anything
-        if await RBACService.check_permission(session, user_id, "admin"):
+        if "admin" in permissions:
             return True
 
         # Owner can do anything to their resource
@@ -151,7 +188,4 @@ class RBACService:
             return True
 
         # Check specific permission
-        permission_name = f"{resource_type}:{action}"
-        return await RBACService.check_permission(session, user_id, permission_name)
-
-
+        return f"{resource_type}:{action}" in permissions
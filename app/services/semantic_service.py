@@ -1,12 +1,205 @@
 """Semantic layer service for parsing and validating semantic JSON."""
 
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional, Union
 
 from app.core.exceptions import SemanticLayerError, ValidationError
 from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Schema constraints, built once rather than per validate_semantic_schema call
+_REQUIRED_FIELDS = ("grain", "time_columns", "dimensions", "measures")
+_VALID_GRAINS = frozenset({"daily", "hourly", "weekly", "monthly"})
+_AGGREGATION_ORDER = ["SUM", "AVG", "COUNT", "MIN", "MAX", "DISTINCT_COUNT"]
+_VALID_AGGREGATIONS = frozenset(_AGGREGATION_ORDER)
+
+
+class FieldIndex(NamedTuple):
+    """Lookup tables validate_field_usage checks fields against."""
+
+    dimensions: frozenset
+    aggregations: dict[str, list]  # aggregation list by measure name
+    allowed: dict[str, frozenset]  # aggregation set by measure name
+
+
+def _build_field_index(schema: dict[str, Any]) -> FieldIndex:
+    """Build the lookup tables validate_field_usage needs for a raw schema."""
+    dimensions = frozenset(d.get("name") for d in schema.get("dimensions", []))
+    aggregations = {m.get("name"): m.get("aggregations", []) for m in schema.get("measures", [])}
+    allowed = {
+        name: frozenset(a for a in aggs if isinstance(a, str))
+        for name, aggs in aggregations.items()
+    }
+    return FieldIndex(dimensions, aggregations, allowed)
+
+
+def _build_ui_fields(schema: dict[str, Any]) -> Mapping[str, Any]:
+    """Build the read-only UI field definitions for a schema."""
+    return MappingProxyType({
+        "dimensions": tuple(
+            MappingProxyType({
+                "id": dim.get("name"),
+                "name": dim.get("name"),
+                "column": dim.get("column"),
+                "type": dim.get("type", "string"),
+                "description": dim.get("description"),
+            })
+            for dim in schema.get("dimensions", [])
+        ),
+        "measures": tuple(
+            MappingProxyType({
+                "id": measure.get("name"),
+                "name": measure.get("name"),
+                "column": measure.get("column"),
+                "type": measure.get("type", "numeric"),
+                "aggregations": tuple(measure.get("aggregations", ())),
+                "description": measure.get("description"),
+                "format": measure.get("format"),  # e.g., currency, percentage
+            })
+            for measure in schema.get("measures", [])
+        ),
+        "time_columns": tuple(schema.get("time_columns", ())),
+        "grain": schema.get("grain"),
+    })
+
+
+def _build_validation_rules(schema: dict[str, Any]) -> Mapping[str, Any]:
+    """Build the read-only validation rules for a schema."""
+    # One pass over measures for both the name list and the aggregation map
+    allowed_measures = []
+    allowed_aggregations = {}
+    for measure in schema.get("measures", []):
+        name = measure.get("name")
+        allowed_measures.append(name)
+        allowed_aggregations[name] = tuple(measure.get("aggregations", ()))
+
+    return MappingProxyType({
+        "allowed_dimensions": tuple(d.get("name") for d in schema.get("dimensions", [])),
+        "allowed_measures": tuple(allowed_measures),
+        "allowed_aggregations": MappingProxyType(allowed_aggregations),
+        "time_columns": tuple(schema.get("time_columns", ())),
+        "grain": schema.get("grain"),
+    })
+
+
+@dataclass(frozen=True, slots=True)
+class Dimension:
+    """A dimension of a semantic layer."""
+
+    name: str
+    column: str
+    type: str = "string"
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Measure:
+    """A measure of a semantic layer."""
+
+    name: str
+    column: str
+    type: str = "numeric"
+    aggregations: tuple[str, ...] = ()
+    description: Optional[str] = None
+    format: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SemanticLayer:
+    """
+    Validated, compiled form of a semantic layer JSON.
+
+    Build with SemanticLayer.from_json (or SemanticService.validate). The
+    raw JSON is kept in ``schema`` for callers that need the original dict;
+    its UI fields and validation rules are built once, as read-only mappings.
+    """
+
+    grain: str
+    time_columns: tuple[str, ...]
+    dimensions: tuple[Dimension, ...]
+    measures: tuple[Measure, ...]
+    schema: dict[str, Any] = field(repr=False, compare=False)
+    dimension_names: frozenset[str] = field(init=False, repr=False, compare=False)
+    measure_by_name: dict[str, Measure] = field(init=False, repr=False, compare=False)
+    field_index: FieldIndex = field(init=False, repr=False, compare=False)
+    ui_fields: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+    validation_rules: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        dimension_names = frozenset(d.name for d in self.dimensions)
+        measure_by_name = {m.name: m for m in self.measures}
+        object.__setattr__(self, "dimension_names", dimension_names)
+        object.__setattr__(self, "measure_by_name", measure_by_name)
+        object.__setattr__(self, "field_index", FieldIndex(
+            dimension_names,
+            {m.name: list(m.aggregations) for m in self.measures},
+            {m.name: frozenset(m.aggregations) for m in self.measures},
+        ))
+        object.__setattr__(self, "ui_fields", _build_ui_fields(self.schema))
+        object.__setattr__(self, "validation_rules", _build_validation_rules(self.schema))
+
+    @classmethod
+    def from_json(cls, schema: dict[str, Any], validated: bool = False) -> "SemanticLayer":
+        """
+        Validate semantic layer JSON and compile it.
+
+        Args:
+            schema: Semantic layer JSON
+            validated: Skip validation; the caller has already run
+                validate_semantic_schema on this schema
+
+        Returns:
+            SemanticLayer
+
+        Raises:
+            ValidationError: If the schema is invalid
+        """
+        if not validated:
+            is_valid, error = SemanticService.validate_semantic_schema(schema)
+            if not is_valid:
+                raise ValidationError(f"Invalid semantic schema: {error}")
+
+        return cls(
+            grain=schema["grain"],
+            time_columns=tuple(schema["time_columns"]),
+            dimensions=tuple(
+                Dimension(
+                    name=d["name"],
+                    column=d["column"],
+                    type=d.get("type", "string"),
+                    description=d.get("description"),
+                )
+                for d in schema["dimensions"]
+            ),
+            measures=tuple(
+                Measure(
+                    name=m["name"],
+                    column=m["column"],
+                    type=m.get("type", "numeric"),
+                    aggregations=tuple(m.get("aggregations", [])),
+                    description=m.get("description"),
+                    format=m.get("format"),
+                )
+                for m in schema["measures"]
+            ),
+            schema=schema,
+        )
+
+
+SchemaLike = Union[dict[str, Any], SemanticLayer]
+
+# Anything validate_field_usage accepts; pass a FieldIndex when checking many fields
+FieldSource = Union[dict[str, Any], SemanticLayer, FieldIndex]
+
+
+def _unwrap(schema: SchemaLike) -> dict[str, Any]:
+    """Return the raw schema dict for either a dict or a compiled layer."""
+    if isinstance(schema, SemanticLayer):
+        return schema.schema
+    return schema
+
 
 class SemanticService:
     """Service for managing semantic layer definitions."""
@@ -22,14 +215,13 @@ class SemanticService:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        required_fields = ["grain", "time_columns", "dimensions", "measures"]
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in schema:
                 return False, f"Missing required field: {field}"
 
         # Validate grain
         grain = schema.get("grain")
-        if not isinstance(grain, str) or grain not in ["daily", "hourly", "weekly", "monthly"]:
+        if not isinstance(grain, str) or grain not in _VALID_GRAINS:
             return False, f"Invalid grain: {grain}. Must be one of: daily, hourly, weekly, monthly"
 
         # Validate time_columns
@@ -51,7 +243,6 @@ class SemanticService:
         if not isinstance(measures, list):
             return False, "measures must be a list"
 
-        allowed_aggregations = ["SUM", "AVG", "COUNT", "MIN", "MAX", "DISTINCT_COUNT"]
         for measure in measures:
             if not isinstance(measure, dict):
                 return False, "Each measure must be a dictionary"
@@ -61,93 +252,93 @@ class SemanticService:
             if not isinstance(aggregations, list):
                 return False, "measure.aggregations must be a list"
             for agg in aggregations:
-                if agg not in allowed_aggregations:
-                    return False, f"Invalid aggregation: {agg}. Allowed: {allowed_aggregations}"
+                if not isinstance(agg, str) or agg not in _VALID_AGGREGATIONS:
+                    return False, f"Invalid aggregation: {agg}. Allowed: {_AGGREGATION_ORDER}"
 
         return True, None
 
     @staticmethod
-    def parse_semantic_to_ui_fields(schema: dict[str, Any]) -> dict[str, Any]:
+    def validate(schema: SchemaLike) -> SemanticLayer:
+        """
+        Validate a semantic schema once and compile it so callers can skip re-validation.
+
+        Args:
+            schema: Semantic layer JSON (or an already compiled SemanticLayer)
+
+        Returns:
+            SemanticLayer for the schema
+
+        Raises:
+            ValidationError: If the schema is invalid
+        """
+        if isinstance(schema, SemanticLayer):
+            return schema
+        return SemanticLayer.from_json(schema)
+
+    @staticmethod
+    def parse_semantic_to_ui_fields(schema: SchemaLike) -> Mapping[str, Any]:
         """
         Convert semantic JSON into UI-selectable fields.
 
         Args:
-            schema: Validated semantic layer JSON
+            schema: Semantic layer JSON; a SemanticLayer skips validation
 
         Returns:
-            Dictionary with UI-ready field definitions
+            Read-only mapping with UI-ready field definitions (lists are tuples)
         """
+        if isinstance(schema, SemanticLayer):
+            return schema.ui_fields
+
         is_valid, error = SemanticService.validate_semantic_schema(schema)
         if not is_valid:
             raise ValidationError(f"Invalid semantic schema: {error}")
+        return _build_ui_fields(schema)
 
-        ui_fields = {
-            "dimensions": [],
-            "measures": [],
-            "time_columns": schema.get("time_columns", []),
-            "grain": schema.get("grain"),
-        }
-
-        # Parse dimensions
-        for dim in schema.get("dimensions", []):
-            ui_fields["dimensions"].append({
-                "id": dim.get("name"),
-                "name": dim.get("name"),
-                "column": dim.get("column"),
-                "type": dim.get("type", "string"),
-                "description": dim.get("description"),
-            })
+    @staticmethod
+    def get_validation_rules(schema: SchemaLike) -> Mapping[str, Any]:
+        """
+        Extract validation rules from semantic schema.
 
-        # Parse measures
-        for measure in schema.get("measures", []):
-            ui_fields["measures"].append({
-                "id": measure.get("name"),
-                "name": measure.get("name"),
-                "column": measure.get("column"),
-                "type": measure.get("type", "numeric"),
-                "aggregations": measure.get("aggregations", []),
-                "description": measure.get("description"),
-                "format": measure.get("format"),  # e.g., currency, percentage
-            })
+        Args:
+            schema: Semantic layer JSON or SemanticLayer
 
-        return ui_fields
+        Returns:
+            Read-only mapping of validation rules (lists are tuples)
+        """
+        if isinstance(schema, SemanticLayer):
+            return schema.validation_rules
+        return _build_validation_rules(schema)
 
     @staticmethod
-    def get_validation_rules(schema: dict[str, Any]) -> dict[str, Any]:
+    def field_index(schema: FieldSource) -> FieldIndex:
         """
-        Extract validation rules from semantic schema.
+        Get the field lookup tables for a schema.
+
+        A SemanticLayer carries them prebuilt; raw JSON is indexed per call,
+        so callers checking several fields of a raw schema should build the
+        index once and pass it to validate_field_usage.
 
         Args:
-            schema: Semantic layer JSON
+            schema: Semantic layer JSON, SemanticLayer or FieldIndex
 
         Returns:
-            Dictionary of validation rules
+            FieldIndex of the schema's dimensions and measure aggregations
         """
-        rules = {
-            "allowed_dimensions": [d.get("name") for d in schema.get("dimensions", [])],
-            "allowed_measures": [m.get("name") for m in schema.get("measures", [])],
-            "allowed_aggregations": {},
-            "time_columns": schema.get("time_columns", []),
-            "grain": schema.get("grain"),
-        }
-
-        # Map measures to their allowed aggregations
-        for measure in schema.get("measures", []):
-            rules["allowed_aggregations"][measure.get("name")] = measure.get(
-                "aggregations", []
-            )
-
-        return rules
+        if isinstance(schema, FieldIndex):
+            return schema
+        if isinstance(schema, SemanticLayer):
+            return schema.field_index
+        return _build_field_index(schema)
 
     @staticmethod
     def validate_field_usage(
-        schema: dict[str, Any], field_name: str, field_type: str, aggregation: Optional[str] = None
+        schema: FieldSource, field_name: str, field_type: str, aggregation: Optional[str] = None
     ) -> tuple[bool, Optional[str]]:
         """
         Validate if a field can be used in a specific way.
 
         Args:
-            schema: Semantic layer JSON
+            schema: Semantic layer JSON, SemanticLayer or prebuilt FieldIndex
             field_name: Name of the field
             field_type: 'dimension' or 'measure'
             aggregation: Aggregation function if measure
@@ -156,24 +347,23 @@ class SemanticService:
             Tuple of (is_valid, error_message)
         """
         if field_type == "dimension":
-            dimensions = [d.get("name") for d in schema.get("dimensions", [])]
+            dimensions, _, _ = SemanticService.field_index(schema)
             if field_name not in dimensions:
                 return False, f"Dimension '{field_name}' not found in semantic layer"
             return True, None
 
         elif field_type == "measure":
-            measures = {m.get("name"): m for m in schema.get("measures", [])}
-            if field_name not in measures:
+            _, aggregations, allowed = SemanticService.field_index(schema)
+            if field_name not in aggregations:
                 return False, f"Measure '{field_name}' not found in semantic layer"
 
-            if aggregation:
-                allowed_aggs = measures[field_name].get("aggregations", [])
-                if aggregation not in allowed_aggs:
-                    return (
-                        False,
-                        f"Aggregation '{aggregation}' not allowed for measure '{field_name}'. "
-                        f"Allowed: {allowed_aggs}",
-                    )
+            if aggregation and aggregation not in allowed[field_name]:
+                allowed_aggs = aggregations[field_name]
+                return (
+                    False,
+                    f"Aggregation '{aggregation}' not allowed for measure '{field_name}'. "
+                    f"Allowed: {allowed_aggs}",
+                )
 
             return True, None
 
@@ -17,7 +17,10 @@ Usage:
         print(f"Invalid SQL: {error}")
 """
 
-from typing import Tuple, Optional, List, Set
+import re
+import hashlib
+from collections import OrderedDict
+from typing import Tuple, Optional, List, Set, FrozenSet, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -65,7 +68,7 @@ class ValidationErrorType(Enum):
 
 # Keywords that indicate dangerous/forbidden operations
 # These are SQL commands that can modify or destroy data
-DANGEROUS_KEYWORDS: Set[str] = {
+DANGEROUS_KEYWORDS: FrozenSet[str] = frozenset({
     # Data Modification
     "INSERT",
     "UPDATE",
@@ -111,11 +114,11 @@ DANGEROUS_KEYWORDS: Set[str] = {
     "INTO OUTFILE",
     "INTO DUMPFILE",
     "LOAD_FILE",
-}
+})
 
-# SQL Injection patterns to detect
+# SQL Injection patterns to detect (uppercase; matched against uppercased SQL)
 # These are common patterns used in SQL injection attacks
-SQL_INJECTION_PATTERNS: List[str] = [
+SQL_INJECTION_PATTERNS: Tuple[str, ...] = (
     # Comment-based injection
     "--",           # SQL comment
     "/*",           # Block comment start
@@ -167,21 +170,63 @@ SQL_INJECTION_PATTERNS: List[str] = [
     "PG_WRITE_FILE",
     "LO_IMPORT",
     "LO_EXPORT",
-]
+)
+
+# All validator regexes are case-insensitive, so the query is scanned as-is
+# instead of through an uppercased copy.
+#
+# Dangerous keywords and injection patterns compiled into one regex at import,
+# so validation is a single scan of the SQL; the named group that matched says
+# which kind of hit it is. The scan is a zero-width lookahead so overlapping
+# hits are all reported (e.g. an allowed trailing "--" does not hide
+# "OR 1=1--"), and keywords are tried first at each position. Longer
+# alternatives come first so the most specific match is reported. Keyword
+# boundaries are explicit ASCII identifier classes rather than \b, which is
+# Unicode-aware and slower, and which let e.g. "éDROP" slip through.
+_FORBIDDEN_RE = re.compile(
+    r"(?=(?P<keyword>(?<![A-Za-z0-9_])(?:"
+    + "|".join(re.escape(kw) for kw in sorted(DANGEROUS_KEYWORDS, key=len, reverse=True))
+    + r")(?![A-Za-z0-9_]))|(?P<injection>"
+    + "|".join(re.escape(p) for p in sorted(SQL_INJECTION_PATTERNS, key=len, reverse=True))
+    + "))",
+    re.IGNORECASE,
+)
+_UNION_RE = re.compile("UNION", re.IGNORECASE)
+
+# First keyword of a statement, and SELECT as a whole word (for CTEs)
+_FIRST_KEYWORD_RE = re.compile(r"\s*([A-Za-z_]+)", re.ASCII)
+_SELECT_TOKEN_RE = re.compile(r"\bSELECT\b", re.IGNORECASE)
+
+# Statement types reported by SQLValidator.get_query_type
+_QUERY_TYPES: FrozenSet[str] = frozenset({
+    "SELECT", "INSERT", "UPDATE", "DELETE", "DROP", "CREATE",
+    "ALTER", "WITH", "TRUNCATE", "GRANT", "REVOKE",
+})
+
+# Table references after FROM / JOIN (simplified - a full SQL parser would be more accurate)
+_TABLE_REF_RE = re.compile(r'\b(?:FROM|JOIN)\s+["\']?([\w.]+)["\']?', re.IGNORECASE)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Validation decisions cached per SQLValidator instance; queries longer than
+# _CACHE_KEY_MAX_CHARS are keyed by digest instead of by the text itself
+_RESULT_CACHE_SIZE = 512
+_CACHE_KEY_MAX_CHARS = 256
 
 # Allowed table names (whitelist approach)
-ALLOWED_TABLES: Set[str] = {
+ALLOWED_TABLES: FrozenSet[str] = frozenset({
     "sales_analytics",
     "public.sales_analytics",
-}
+})
+_ALLOWED_TABLES_LOWER: FrozenSet[str] = frozenset(t.lower() for t in ALLOWED_TABLES)
 
 # =============================================================================
 # STEP 3: Validation Result and SQLValidator Class Structure
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
-    """Result of SQL validation."""
+    """Result of SQL validation (immutable; cached results are shared)."""
     is_valid: bool
     error_message: Optional[str] = None
     error_type: Optional[ValidationErrorType] = None
@@ -193,6 +238,10 @@ class ValidationResult:
         return self.is_valid
 
 
+# Shared result for checks that pass (carries no extra fields)
+_VALID = ValidationResult(is_valid=True)
+
+
 class SQLValidator:
     """
     Validates SQL queries for safety and correctness.
@@ -235,13 +284,20 @@ class SQLValidator:
             allow_cte: Whether to allow Common Table Expressions (WITH clause)
             strict_mode: If True, applies stricter validation rules
         """
-        self.allowed_tables = allowed_tables or ALLOWED_TABLES
+        # Own copy: add_allowed_table/remove_allowed_table mutate it
+        self.allowed_tables = set(allowed_tables or ALLOWED_TABLES)
+        self._allowed_lower = (
+            frozenset(t.lower() for t in allowed_tables)
+            if allowed_tables
+            else _ALLOWED_TABLES_LOWER
+        )
         self.max_query_length = max_query_length
         self.allow_subqueries = allow_subqueries
         self.allow_cte = allow_cte
         self.strict_mode = strict_mode
+        self._cache: "OrderedDict[Union[str, bytes], ValidationResult]" = OrderedDict()
         
-        logger.info(f"SQLValidator initialized with {len(self.allowed_tables)} allowed tables")
+        logger.debug("SQLValidator initialized with %d allowed tables", len(self.allowed_tables))
 
     # =========================================================================
     # STEP 4: Main Validation Method
@@ -260,20 +316,17 @@ class SQLValidator:
         Returns:
             ValidationResult with is_valid=True if safe, False otherwise
         """
-        warnings = []
+        # Normalize the SQL (trim whitespace; checks are case-insensitive)
+        sql_normalized = sql.strip() if sql else ""
         
         # Check 1: Empty or None query
-        if not sql or not sql.strip():
+        if not sql_normalized:
             return ValidationResult(
                 is_valid=False,
                 error_message="SQL query is empty",
                 error_type=ValidationErrorType.EMPTY_QUERY,
             )
         
-        # Normalize the SQL (trim whitespace, convert to uppercase for checking)
-        sql_normalized = sql.strip()
-        sql_upper = sql_normalized.upper()
-        
         # Check 2: Query length
         if len(sql_normalized) > self.max_query_length:
             return ValidationResult(
@@ -282,23 +335,64 @@ class SQLValidator:
                 error_type=ValidationErrorType.SYNTAX_ERROR,
             )
         
+        # LLM output repeats (retries, re-asks, dashboard refreshes), so
+        # decisions are cached
+        key = (
+            sql_normalized
+            if len(sql_normalized) <= _CACHE_KEY_MAX_CHARS
+            else hashlib.blake2b(sql_normalized.encode(), digest_size=16).digest()
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        
+        result = self._run_checks(sql_normalized)
+        self._cache[key] = result
+        if len(self._cache) > _RESULT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+    
+    def validate_batch(self, sqls: List[str]) -> List[ValidationResult]:
+        """
+        Validate many SQL queries, e.g. when replaying a query log.
+        
+        Each distinct query is validated once per batch, even when the batch
+        holds more distinct queries than the decision cache.
+        
+        Args:
+            sqls: SQL query strings to validate
+            
+        Returns:
+            One ValidationResult per input, in order
+        """
+        seen: dict = {}
+        results = []
+        for sql in sqls:
+            result = seen.get(sql)
+            if result is None:
+                result = seen[sql] = self.validate(sql)
+            results.append(result)
+        return results
+    
+    def _run_checks(self, sql_normalized: str) -> ValidationResult:
+        """Run checks 3-7 on a trimmed, length-checked query."""
+        warnings = []
+        
         # Check 3: Multiple statements (semicolon in middle)
         result = self._check_multiple_statements(sql_normalized)
         if not result.is_valid:
             return result
         
         # Check 4: Must be a SELECT query (or WITH for CTE)
-        result = self._check_is_select_query(sql_upper)
+        match = _FIRST_KEYWORD_RE.match(sql_normalized)
+        first_keyword = match.group(1).upper() if match else "UNKNOWN"
+        result = self._check_is_select_query(first_keyword, sql_normalized)
         if not result.is_valid:
             return result
         
-        # Check 5: Dangerous keywords
-        result = self._check_dangerous_keywords(sql_upper)
-        if not result.is_valid:
-            return result
-        
-        # Check 6: SQL injection patterns
-        result = self._check_injection_patterns(sql_upper, sql_normalized)
+        # Check 5 + 6: Dangerous keywords and SQL injection patterns (one scan)
+        result = self._check_forbidden_patterns(sql_normalized)
         if not result.is_valid:
             return result
         
@@ -326,37 +420,38 @@ class SQLValidator:
         
         We allow semicolon only at the very end of the query.
         """
-        # Remove trailing semicolon for this check
-        sql_check = sql.rstrip(';').strip()
+        # Ignore trailing semicolons, then look for any other one (no copies)
+        end = len(sql)
+        while end and sql[end - 1] == ';':
+            end -= 1
         
-        if ';' in sql_check:
+        if sql.find(';', 0, end) != -1:
             return ValidationResult(
                 is_valid=False,
                 error_message="Multiple SQL statements detected. Only single SELECT queries are allowed.",
                 error_type=ValidationErrorType.MULTIPLE_STATEMENTS,
             )
         
-        return ValidationResult(is_valid=True)
+        return _VALID
     
-    def _check_is_select_query(self, sql_upper: str) -> ValidationResult:
+    def _check_is_select_query(self, keyword: str, sql: str) -> ValidationResult:
         """
         Verify the query is a SELECT statement (or WITH for CTE).
         
         We only allow SELECT queries to prevent data modification.
+        ``keyword`` is the query's uppercased first keyword, read once by
+        validate(); ``sql`` is only scanned for WITH queries.
         """
-        # Remove leading whitespace and check first keyword
-        sql_stripped = sql_upper.strip()
-        
         # Check for SELECT
-        if sql_stripped.startswith("SELECT"):
-            return ValidationResult(is_valid=True)
+        if keyword == "SELECT":
+            return _VALID
         
         # Check for WITH (Common Table Expression) - must end with SELECT
-        if sql_stripped.startswith("WITH"):
+        if keyword == "WITH":
             if self.allow_cte:
                 # CTE must contain SELECT
-                if "SELECT" in sql_stripped:
-                    return ValidationResult(is_valid=True)
+                if _SELECT_TOKEN_RE.search(sql):
+                    return _VALID
                 else:
                     return ValidationResult(
                         is_valid=False,
@@ -370,75 +465,68 @@ class SQLValidator:
                     error_type=ValidationErrorType.NON_SELECT_QUERY,
                 )
         
-        # Identify what type of query it is for better error message
-        first_keyword = sql_stripped.split()[0] if sql_stripped.split() else "UNKNOWN"
-        
+        # Name what the query starts with, e.g. "(SELECT" when it is not a keyword
+        found = keyword if keyword != "UNKNOWN" else sql.split(maxsplit=1)[0].upper()
         return ValidationResult(
             is_valid=False,
-            error_message=f"Only SELECT queries are allowed. Found: {first_keyword}",
+            error_message=f"Only SELECT queries are allowed. Found: {found}",
             error_type=ValidationErrorType.NON_SELECT_QUERY,
         )
     
-    def _check_dangerous_keywords(self, sql_upper: str) -> ValidationResult:
-        """
-        Check for dangerous SQL keywords that could modify data or schema.
-        
-        Uses word boundary detection to avoid false positives like
-        'updated_at' matching 'UPDATE'.
-        """
-        import re
-        
-        for keyword in DANGEROUS_KEYWORDS:
-            # Use word boundary to avoid false positives
-            # e.g., "updated_at" should not match "UPDATE"
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            
-            if re.search(pattern, sql_upper):
-                return ValidationResult(
-                    is_valid=False,
-                    error_message=f"Dangerous SQL keyword detected: {keyword}",
-                    error_type=ValidationErrorType.DANGEROUS_KEYWORD,
-                )
-        
-        return ValidationResult(is_valid=True)
-    
-    def _check_injection_patterns(self, sql_upper: str, sql_original: str) -> ValidationResult:
+    def _check_forbidden_patterns(self, sql: str) -> ValidationResult:
         """
-        Check for common SQL injection patterns.
+        Check for dangerous keywords and common SQL injection patterns.
         
-        This catches patterns like:
+        Keywords use word boundaries to avoid false positives like
+        'updated_at' matching 'UPDATE', and take precedence over injection
+        patterns. Injection patterns catch:
         - Comment injection (-- , /*, */)
         - Union injection
         - Boolean-based injection
         - Time-based injection
         """
-        for pattern in SQL_INJECTION_PATTERNS:
-            pattern_upper = pattern.upper()
-            
-            if pattern_upper in sql_upper:
-                # Special case: Allow legitimate use of -- only at end of query
-                if pattern == "--" and sql_original.strip().endswith("--"):
-                    continue
-                
-                # Special case: UNION is legitimate in some queries
-                # But UNION followed by SELECT with injection keywords is suspicious
-                if "UNION" in pattern_upper:
-                    # Check if it looks like injection (has multiple unions or suspicious patterns)
-                    if sql_upper.count("UNION") > 2:
-                        return ValidationResult(
-                            is_valid=False,
-                            error_message=f"Potential SQL injection pattern detected: {pattern}",
-                            error_type=ValidationErrorType.INJECTION_DETECTED,
-                        )
-                    continue  # Allow single UNION for legitimate queries
-                
+        injection_error = None
+        
+        for match in _FORBIDDEN_RE.finditer(sql):
+            if match.lastgroup == "keyword":
                 return ValidationResult(
                     is_valid=False,
-                    error_message=f"Potential SQL injection pattern detected: {pattern}",
-                    error_type=ValidationErrorType.INJECTION_DETECTED,
+                    error_message=f"Dangerous SQL keyword detected: {match.group('keyword').upper()}",
+                    error_type=ValidationErrorType.DANGEROUS_KEYWORD,
                 )
+            
+            # Keep scanning after an injection hit: a keyword later on wins
+            if injection_error is not None:
+                continue
+            
+            pattern = match.group("injection").upper()
+            
+            # Special case: Allow legitimate use of -- only at end of query
+            if pattern == "--" and sql.strip().endswith("--"):
+                continue
+            
+            # Special case: UNION is legitimate in some queries
+            # But UNION followed by SELECT with injection keywords is suspicious
+            if "UNION" in pattern:
+                # Check if it looks like injection (has multiple unions or suspicious patterns)
+                if len(_UNION_RE.findall(sql)) > 2:
+                    injection_error = ValidationResult(
+                        is_valid=False,
+                        error_message=f"Potential SQL injection pattern detected: {pattern}",
+                        error_type=ValidationErrorType.INJECTION_DETECTED,
+                    )
+                continue  # Allow single UNION for legitimate queries
+            
+            injection_error = ValidationResult(
+                is_valid=False,
+                error_message=f"Potential SQL injection pattern detected: {pattern}",
+                error_type=ValidationErrorType.INJECTION_DETECTED,
+            )
         
-        return ValidationResult(is_valid=True)
+        if injection_error is not None:
+            return injection_error
+        
+        return _VALID
     
     def _check_table_names(self, sql: str) -> ValidationResult:
         """
@@ -446,38 +534,13 @@ class SQLValidator:
         
         This is a whitelist approach - only tables in ALLOWED_TABLES can be queried.
         """
-        import re
-        
-        # Extract table names from FROM and JOIN clauses
-        sql_upper = sql.upper()
-        
-        # Pattern to match table names after FROM or JOIN
-        # This is simplified - a full SQL parser would be more accurate
-        from_pattern = r'\bFROM\s+(["\']?[\w.]+["\']?)'
-        join_pattern = r'\bJOIN\s+(["\']?[\w.]+["\']?)'
-        
-        tables_found = set()
-        
-        # Find tables in FROM clause
-        from_matches = re.findall(from_pattern, sql_upper)
-        tables_found.update(from_matches)
-        
-        # Find tables in JOIN clauses
-        join_matches = re.findall(join_pattern, sql_upper)
-        tables_found.update(join_matches)
-        
-        # Clean up table names (remove quotes, normalize)
-        cleaned_tables = set()
-        for table in tables_found:
-            # Remove quotes
-            table_clean = table.strip('"\'').lower()
-            cleaned_tables.add(table_clean)
+        # Extract table names from FROM and JOIN clauses (one scan; quotes
+        # are outside the captured group)
+        cleaned_tables = {table.lower() for table in _TABLE_REF_RE.findall(sql)}
         
         # Check against whitelist
-        allowed_lower = {t.lower() for t in self.allowed_tables}
-        
         for table in cleaned_tables:
-            if table not in allowed_lower:
+            if table not in self._allowed_lower:
                 # Check if it might be an alias or subquery
                 # Subqueries won't have a real table name in this simple check
                 if not self.allow_subqueries:
@@ -490,7 +553,7 @@ class SQLValidator:
                     # Log warning but allow - could be subquery alias
                     logger.warning(f"Unknown table reference (could be alias/subquery): {table}")
         
-        return ValidationResult(is_valid=True)
+        return _VALID
 
     # =========================================================================
     # STEP 6: Utility Methods
@@ -519,8 +582,7 @@ class SQLValidator:
         sql = sql.rstrip(';').strip()
         
         # Normalize whitespace
-        import re
-        sql = re.sub(r'\s+', ' ', sql)
+        sql = _WHITESPACE_RE.sub(' ', sql)
         
         return sql
     
@@ -537,16 +599,12 @@ class SQLValidator:
         if not sql:
             return "UNKNOWN"
         
-        sql_upper = sql.strip().upper()
-        
-        keywords = ["SELECT", "INSERT", "UPDATE", "DELETE", "DROP", "CREATE", 
-                    "ALTER", "WITH", "TRUNCATE", "GRANT", "REVOKE"]
-        
-        for keyword in keywords:
-            if sql_upper.startswith(keyword):
-                return keyword
+        match = _FIRST_KEYWORD_RE.match(sql)
+        if not match:
+            return "UNKNOWN"
         
-        return "UNKNOWN"
+        keyword = match.group(1).upper()
+        return keyword if keyword in _QUERY_TYPES else "UNKNOWN"
     
     def add_allowed_table(self, table_name: str) -> None:
         """
@@ -556,6 +614,8 @@ class SQLValidator:
             table_name: Table name to allow
         """
         self.allowed_tables.add(table_name.lower())
+        self._allowed_lower = frozenset(t.lower() for t in self.allowed_tables)
+        self._cache.clear()
         logger.info(f"Added allowed table: {table_name}")
     
     def remove_allowed_table(self, table_name: str) -> None:
@@ -566,6 +626,8 @@ class SQLValidator:
             table_name: Table name to remove
         """
         self.allowed_tables.discard(table_name.lower())
+        self._allowed_lower = frozenset(t.lower() for t in self.allowed_tables)
+        self._cache.clear()
         logger.info(f"Removed allowed table: {table_name}")
 
 
@@ -1,7 +1,9 @@
 """Time intelligence engine for period comparisons."""
 
+import re
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence
 from enum import Enum
 
 from app.core.exceptions import ValidationError
@@ -9,6 +11,9 @@ from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# {start}/{end} placeholders in parameterized comparison queries
+_PERIOD_PLACEHOLDER_RE = re.compile(r"\{(start|end)\}")
+
 
 class TimeComparison(str, Enum):
     """Supported time comparison types."""
@@ -26,6 +31,7 @@ class TimeIntelligenceEngine:
     """Engine for time-based analytics comparisons."""
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def calculate_time_range(
         comparison_type: TimeComparison,
         base_start: datetime,
@@ -35,6 +41,9 @@ class TimeIntelligenceEngine:
         """
         Calculate time range for comparison.
 
+        Results are memoized, since the range depends only on the arguments
+        and dashboard refreshes ask for the same windows over and over.
+
         Args:
             comparison_type: Type of comparison
             base_start: Base period start date
@@ -101,6 +110,12 @@ class TimeIntelligenceEngine:
         """
         Generate SQL query for time comparison.
 
+        The preferred form of base_query marks the period bounds with
+        ``{start}`` and ``{end}`` placeholders, which are substituted in a
+        single pass with quoted timestamp literals. Queries without
+        placeholders fall back to replacing the literal
+        ``time_column >= '...' AND time_column <= '...'`` filter.
+
         Args:
             base_query: Base SQL query
             time_column: Time column name
@@ -116,13 +131,20 @@ class TimeIntelligenceEngine:
             comparison_type, base_start, base_end, grain
         )
 
-        # Replace time filter in base query
-        # This is simplified - in production, use proper SQL parsing
+        if _PERIOD_PLACEHOLDER_RE.search(base_query):
+            bounds = {"start": f"'{comp_start}'", "end": f"'{comp_end}'"}
+            return _PERIOD_PLACEHOLDER_RE.sub(lambda m: bounds[m.group(1)], base_query)
+
         old_filter = f"{time_column} >= '{base_start}' AND {time_column} <= '{base_end}'"
-        new_filter = f"{time_column} >= '{comp_start}' AND {time_column} <= '{comp_end}'"
+        if old_filter not in base_query:
+            logger.warning(
+                f"Time filter on {time_column} not found in base query; "
+                "comparison query is unchanged"
+            )
+            return base_query
 
-        comparison_query = base_query.replace(old_filter, new_filter)
-        return comparison_query
+        new_filter = f"{time_column} >= '{comp_start}' AND {time_column} <= '{comp_end}'"
+        return base_query.replace(old_filter, new_filter)
 
     @staticmethod
     def calculate_percentage_change(
@@ -142,6 +164,33 @@ class TimeIntelligenceEngine:
             return None
         return ((current_value - previous_value) / previous_value) * 100
 
+    @staticmethod
+    def calculate_percentage_changes(
+        current_values: Sequence[float], previous_values: Sequence[float]
+    ) -> list[Optional[float]]:
+        """
+        Calculate percentage changes for paired series of values.
+
+        Equivalent to calling calculate_percentage_change per pair, without
+        the per-element method call when comparing many KPI rows at once.
+
+        Args:
+            current_values: Current period values
+            previous_values: Previous period values, aligned with current_values
+
+        Returns:
+            Percentage change per pair, None where the previous value is 0
+
+        Raises:
+            ValidationError: If the series have different lengths
+        """
+        if len(current_values) != len(previous_values):
+            raise ValidationError("Current and previous series must have the same length")
+        return [
+            None if prev == 0 else ((curr - prev) / prev) * 100
+            for curr, prev in zip(current_values, previous_values)
+        ]
+
     @staticmethod
     def validate_time_range(
         start_date: datetime, end_date: datetime, grain: str
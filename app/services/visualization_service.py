@@ -7,12 +7,25 @@ from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Display lists keep error messages stable; frozensets back membership checks
+_VISUAL_TYPES_DISPLAY = ["kpi", "line", "bar", "column", "stacked_bar", "table", "pie"]
+_SORT_ORDERS_DISPLAY = ["asc", "desc"]
+_TIME_GRAINS_DISPLAY = ["daily", "hourly", "weekly", "monthly", "yearly"]
+_VALID_TIME_GRAINS = frozenset(_TIME_GRAINS_DISPLAY)
+
+
+def _normalize_measure(measure: Any) -> tuple[Any, Optional[str]]:
+    """Return (name, aggregation) for a measure given as a dict or a bare name."""
+    if isinstance(measure, dict):
+        return measure.get("name"), measure.get("aggregation")
+    return measure, None
+
 
 class VisualizationService:
     """Service for managing visualization configurations."""
 
-    VALID_VISUAL_TYPES = ["kpi", "line", "bar", "column", "stacked_bar", "table", "pie"]
-    VALID_SORT_ORDERS = ["asc", "desc"]
+    VALID_VISUAL_TYPES = frozenset(_VISUAL_TYPES_DISPLAY)
+    VALID_SORT_ORDERS = frozenset(_SORT_ORDERS_DISPLAY)
 
     @staticmethod
     def validate_visual_config(
@@ -29,8 +42,8 @@ class VisualizationService:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if visual_type not in VisualizationService.VALID_VISUAL_TYPES:
-            return False, f"Invalid visual type: {visual_type}. Valid types: {VisualizationService.VALID_VISUAL_TYPES}"
+        if not isinstance(visual_type, str) or visual_type not in VisualizationService.VALID_VISUAL_TYPES:
+            return False, f"Invalid visual type: {visual_type}. Valid types: {_VISUAL_TYPES_DISPLAY}"
 
         # Validate required fields based on visual type
         if visual_type == "kpi":
@@ -42,7 +55,8 @@ class VisualizationService:
             if "measures" not in config or not config.get("measures"):
                 return False, f"{visual_type} visual requires at least one measure"
 
-        # Validate measures structure
+        # Validate measures structure, normalizing to (name, aggregation) pairs
+        measure_pairs: list[tuple[Any, Optional[str]]] = []
         if "measures" in config:
             for measure in config["measures"]:
                 if not isinstance(measure, dict):
@@ -51,6 +65,7 @@ class VisualizationService:
                     return False, "Each measure must have 'name' field"
                 if "aggregation" not in measure:
                     return False, "Each measure must have 'aggregation' field"
+                measure_pairs.append((measure["name"], measure["aggregation"]))
 
         # Validate sorting if provided
         if "sorting" in config:
@@ -59,36 +74,35 @@ class VisualizationService:
                 return False, "sorting must be a dictionary"
             if "field" not in sorting or "order" not in sorting:
                 return False, "sorting must have 'field' and 'order' fields"
-            if sorting["order"] not in VisualizationService.VALID_SORT_ORDERS:
-                return False, f"sorting.order must be one of: {VisualizationService.VALID_SORT_ORDERS}"
+            order = sorting["order"]
+            if not isinstance(order, str) or order not in VisualizationService.VALID_SORT_ORDERS:
+                return False, f"sorting.order must be one of: {_SORT_ORDERS_DISPLAY}"
 
         # Validate time_grain if provided
         if "time_grain" in config:
-            valid_grains = ["daily", "hourly", "weekly", "monthly", "yearly"]
-            if config["time_grain"] not in valid_grains:
-                return False, f"time_grain must be one of: {valid_grains}"
+            time_grain = config["time_grain"]
+            if not isinstance(time_grain, str) or time_grain not in _VALID_TIME_GRAINS:
+                return False, f"time_grain must be one of: {_TIME_GRAINS_DISPLAY}"
 
         # Validate against semantic schema if provided
         if semantic_schema:
             from app.services.semantic_service import SemanticService
 
+            field_index = SemanticService.field_index(semantic_schema)
             if "dimensions" in config:
                 for dim in config["dimensions"]:
                     is_valid, error = SemanticService.validate_field_usage(
-                        semantic_schema, dim, "dimension"
+                        field_index, dim, "dimension"
                     )
                     if not is_valid:
                         return False, f"Dimension validation: {error}"
 
-            measures = config.get("measures", [])
-            if not measures and "measure" in config:
-                measures = [config["measure"]]
+            if not measure_pairs and "measure" in config:
+                measure_pairs = [_normalize_measure(config["measure"])]
 
-            for measure in measures:
-                measure_name = measure.get("name") if isinstance(measure, dict) else measure
-                aggregation = measure.get("aggregation") if isinstance(measure, dict) else None
+            for measure_name, aggregation in measure_pairs:
                 is_valid, error = SemanticService.validate_field_usage(
-                    semantic_schema, measure_name, "measure", aggregation
+                    field_index, measure_name, "measure", aggregation
                 )
                 if not is_valid:
                     return False, f"Measure validation: {error}"
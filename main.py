@@ -3,16 +3,19 @@
 from dotenv import load_dotenv
 load_dotenv()  # Load environment variables from .env file
 
+import hashlib
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
+from app.core.cache import start_invalidation_listener, stop_invalidation_listener
 from app.core.config import get_settings
 from app.core.logging_config import setup_logging
 from app.core.database import init_db, close_db
 from app.core.exceptions import AnalyticsStudioException
+from app.services.llm_service import init_llm_service, close_llm_service
 from app.api.exception_handlers import (
     analytics_studio_exception_handler,
     validation_exception_handler,
@@ -21,10 +24,7 @@ from app.api.exception_handlers import (
 from app.api.v1 import api_router
 from fastapi.exceptions import RequestValidationError
 
-# Setup logging
-setup_logging()
-
-# Get settings
+# Get settings (cached; logging is configured at startup, once per worker)
 settings = get_settings()
 
 
@@ -32,9 +32,14 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
+    setup_logging()
     await init_db()
+    cache_listener = await start_invalidation_listener()
+    init_llm_service()
     yield
     # Shutdown
+    await stop_invalidation_listener(cache_listener)
+    await close_llm_service()
     await close_db()
 
 
@@ -80,26 +85,54 @@ app.add_exception_handler(
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 
+def _static_json(content: dict) -> tuple[bytes, str]:
+    """Serialize a constant payload once and derive its strong ETag."""
+    body = orjson.dumps(content)
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+# / never changes for the life of the process: serve a prebuilt body with an
+# ETag so clients and fronting caches can revalidate with a 304
+_ROOT_BODY, _ROOT_ETAG = _static_json({
+    "message": "Analytics Studio API",
+    "version": settings.APP_VERSION,
+    "status": "operational",
+    "docs": "/docs",
+})
+_STATIC_CACHE_CONTROL = "public, max-age=10"
+
+# /health is prebuilt too, but must never be served from a cache: a cached
+# "healthy" would outlive the process it describes
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+})
+
+
+def _static_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return body, or 304 Not Modified if the client already holds etag."""
+    headers = {"ETag": etag, "Cache-Control": _STATIC_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip() for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint."""
-    return {
-        "message": "Analytics Studio API",
-        "version": settings.APP_VERSION,
-        "status": "operational",
-        "docs": "/docs",
-    }
+    return _static_response(request, _ROOT_BODY, _ROOT_ETAG)
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "healthy",
-            "service": settings.APP_NAME,
-            "version": settings.APP_VERSION,
-        },
+    return Response(
+        content=_HEALTH_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "no-store"},
     )
-
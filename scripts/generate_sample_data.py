@@ -7,9 +7,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from app.core.database import Base, get_db
-from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal, close_db
 from app.models.project import Project
 from app.models.dataset import Dataset, DatasetVersion
 from app.models.semantic import SemanticDefinition, SemanticVersion
@@ -17,21 +15,19 @@ from app.models.dashboard import Dashboard, DashboardVisual
 from app.models.calculation import CalculatedMeasure, MeasureVersion
 from datetime import datetime
 
-settings = get_settings()
-
 
 async def generate_sample_data():
     """Generate sample data for testing."""
-    # Create engine and session
-    engine = create_async_engine(settings.database_url.replace("+asyncpg", ""))
-    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    # Progress lines are buffered and written once at the end
+    out: list[str] = []
 
-    async with async_session() as session:
+    # Reuse the application's engine and session factory
+    async with AsyncSessionLocal() as session:
         try:
-            print("🚀 Generating sample data...\n")
+            out.append("🚀 Generating sample data...\n")
 
             # 1. Create Projects
-            print("📁 Creating projects...")
+            out.append("📁 Creating projects...")
             project1 = Project(
                 name="Sales Analytics",
                 description="Sales team analytics workspace",
@@ -42,14 +38,13 @@ async def generate_sample_data():
                 description="Marketing team analytics workspace",
                 created_by="admin",
             )
-            session.add(project1)
-            session.add(project2)
+            session.add_all([project1, project2])
             await session.flush()
-            print(f"   ✅ Created project: {project1.name} (ID: {project1.id})")
-            print(f"   ✅ Created project: {project2.name} (ID: {project2.id})\n")
+            out.append(f"   ✅ Created project: {project1.name} (ID: {project1.id})")
+            out.append(f"   ✅ Created project: {project2.name} (ID: {project2.id})\n")
 
             # 2. Create Datasets
-            print("📊 Creating datasets...")
+            out.append("📊 Creating datasets...")
             dataset1 = Dataset(
                 id="sales_data",
                 project_id=project1.id,
@@ -81,13 +76,12 @@ async def generate_sample_data():
                 created_by="admin",
             )
 
-            session.add(dataset1)
-            session.add(dataset2)
-            session.add(dataset3)
-            await session.flush()
-            print(f"   ✅ Created dataset: {dataset1.name} (ID: {dataset1.id})")
-            print(f"   ✅ Created dataset: {dataset2.name} (ID: {dataset2.id})")
-            print(f"   ✅ Created dataset: {dataset3.name} (ID: {dataset3.id})\n")
+            # Dataset ids are explicit, so they are usable before any flush;
+            # everything below that needs a generated id is flushed together
+            session.add_all([dataset1, dataset2, dataset3])
+            out.append(f"   ✅ Created dataset: {dataset1.name} (ID: {dataset1.id})")
+            out.append(f"   ✅ Created dataset: {dataset2.name} (ID: {dataset2.id})")
+            out.append(f"   ✅ Created dataset: {dataset3.name} (ID: {dataset3.id})\n")
 
             # Create dataset versions
             version1 = DatasetVersion(
@@ -98,17 +92,40 @@ async def generate_sample_data():
             )
             session.add(version1)
 
-            # 3. Create Semantic Definitions
-            print("🔍 Creating semantic definitions...")
+            # 3-5. Parent rows of semantic, measure and dashboard versions
+            out.append("🔍 Creating semantic definitions, calculated measures and dashboards...")
             semantic1 = SemanticDefinition(
                 dataset_id=dataset1.id,
                 name="Sales Semantic Layer",
                 description="Semantic layer for sales data",
                 created_by="admin",
             )
-            session.add(semantic1)
+            measure1 = CalculatedMeasure(
+                dataset_id=dataset1.id,
+                name="Profit Margin",
+                description="Revenue minus cost divided by revenue",
+                created_by="admin",
+            )
+            dashboard1 = Dashboard(
+                project_id=project1.id,
+                name="Sales Overview",
+                description="Key sales metrics and trends",
+                layout_config={"columns": 12, "rows": 8, "cell_height": 100},
+                is_public=False,
+                created_by="admin",
+            )
+            dashboard2 = Dashboard(
+                project_id=project2.id,
+                name="Campaign Performance",
+                description="Marketing campaign analytics",
+                layout_config={"columns": 12, "rows": 6, "cell_height": 100},
+                is_public=False,
+                created_by="admin",
+            )
+            session.add_all([semantic1, measure1, dashboard1, dashboard2])
             await session.flush()
 
+            # 3. Semantic version
             semantic_version1 = SemanticVersion(
                 semantic_definition_id=semantic1.id,
                 version=1,
@@ -163,20 +180,9 @@ async def generate_sample_data():
                 is_current=True,
                 created_by="admin",
             )
-            session.add(semantic_version1)
-            print(f"   ✅ Created semantic definition for {dataset1.name}\n")
-
-            # 4. Create Calculated Measures
-            print("🧮 Creating calculated measures...")
-            measure1 = CalculatedMeasure(
-                dataset_id=dataset1.id,
-                name="Profit Margin",
-                description="Revenue minus cost divided by revenue",
-                created_by="admin",
-            )
-            session.add(measure1)
-            await session.flush()
+            out.append(f"   ✅ Created semantic definition for {dataset1.name}")
 
+            # 4. Calculated measure version
             measure_version1 = MeasureVersion(
                 measure_id=measure1.id,
                 version=1,
@@ -185,23 +191,9 @@ async def generate_sample_data():
                 is_valid=True,
                 created_by="admin",
             )
-            session.add(measure_version1)
-            print(f"   ✅ Created calculated measure: {measure1.name}\n")
+            out.append(f"   ✅ Created calculated measure: {measure1.name}")
 
-            # 5. Create Dashboards
-            print("📈 Creating dashboards...")
-            dashboard1 = Dashboard(
-                project_id=project1.id,
-                name="Sales Overview",
-                description="Key sales metrics and trends",
-                layout_config={"columns": 12, "rows": 8, "cell_height": 100},
-                is_public=False,
-                created_by="admin",
-            )
-            session.add(dashboard1)
-            await session.flush()
-
-            # Add visuals to dashboard
+            # 5. Add visuals to dashboard
             visual1 = DashboardVisual(
                 dashboard_id=dashboard1.id,
                 visual_type="kpi",
@@ -248,48 +240,38 @@ async def generate_sample_data():
                 order=1,
             )
 
-            session.add(visual1)
-            session.add(visual2)
-
-            dashboard2 = Dashboard(
-                project_id=project2.id,
-                name="Campaign Performance",
-                description="Marketing campaign analytics",
-                layout_config={"columns": 12, "rows": 6, "cell_height": 100},
-                is_public=False,
-                created_by="admin",
-            )
-            session.add(dashboard2)
+            session.add_all([semantic_version1, measure_version1, visual1, visual2])
 
-            print(f"   ✅ Created dashboard: {dashboard1.name} (ID: {dashboard1.id})")
-            print(f"   ✅ Created dashboard: {dashboard2.name} (ID: {dashboard2.id})\n")
+            out.append(f"   ✅ Created dashboard: {dashboard1.name} (ID: {dashboard1.id})")
+            out.append(f"   ✅ Created dashboard: {dashboard2.name} (ID: {dashboard2.id})\n")
 
             # Commit all changes
             await session.commit()
-            print("✅ All sample data generated successfully!\n")
+            out.append("✅ All sample data generated successfully!\n")
 
             # Print summary
-            print("📋 Summary:")
-            print(f"   Projects: 2")
-            print(f"   Datasets: 3")
-            print(f"   Semantic Definitions: 1")
-            print(f"   Calculated Measures: 1")
-            print(f"   Dashboards: 2")
-            print(f"   Dashboard Visuals: 2\n")
+            out.append("📋 Summary:")
+            out.append(f"   Projects: 2")
+            out.append(f"   Datasets: 3")
+            out.append(f"   Semantic Definitions: 1")
+            out.append(f"   Calculated Measures: 1")
+            out.append(f"   Dashboards: 2")
+            out.append(f"   Dashboard Visuals: 2\n")
 
-            print("🎯 Test the API:")
-            print(f"   GET /api/v1/projects")
-            print(f"   GET /api/v1/datasets?project_id={project1.id}")
-            print(f"   GET /api/v1/dashboards?project_id={project1.id}")
-            print(f"   GET /api/v1/datasets/{dataset1.id}")
+            out.append("🎯 Test the API:")
+            out.append(f"   GET /api/v1/projects")
+            out.append(f"   GET /api/v1/datasets?project_id={project1.id}")
+            out.append(f"   GET /api/v1/dashboards?project_id={project1.id}")
+            out.append(f"   GET /api/v1/datasets/{dataset1.id}")
 
         except Exception as e:
             await session.rollback()
-            print(f"❌ Error generating sample data: {e}")
+            out.append(f"❌ Error generating sample data: {e}")
             import traceback
             traceback.print_exc()
         finally:
-            await engine.dispose()
+            sys.stdout.write("\n".join(out) + "\n")
+            await close_db()
 
 
 if __name__ == "__main__":
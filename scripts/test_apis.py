@@ -1,106 +1,113 @@
 """Test APIs to verify everything is working."""
 
-import requests
-import json
+import asyncio
+import sys
+
+import httpx
+import orjson
 
 BASE_URL = "http://localhost:8000"
 
-def test_api(endpoint, method="GET", data=None):
-    """Test an API endpoint."""
-    url = f"{BASE_URL}{endpoint}"
+def _dump(value):
+    """Pretty-print a JSON value for the report."""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2, default=str).decode()
+
+async def test_api(client, endpoint, method="GET", data=None):
+    """Test an API endpoint, returning (passed, report) so output can be printed in order."""
+    out = [f"\n{'='*60}", f"{method} {endpoint}"]
     try:
         if method == "GET":
-            response = requests.get(url)
+            response = await client.get(endpoint)
         elif method == "POST":
-            response = requests.post(url, json=data)
+            response = await client.post(endpoint, json=data)
         elif method == "PATCH":
-            response = requests.patch(url, json=data)
+            response = await client.patch(endpoint, json=data)
         elif method == "DELETE":
-            response = requests.delete(url)
+            response = await client.delete(endpoint)
         
-        print(f"\n{'='*60}")
-        print(f"{method} {endpoint}")
-        print(f"Status: {response.status_code}")
+        out.append(f"Status: {response.status_code}")
         
         if response.status_code < 400:
-            print("✅ SUCCESS")
+            out.append("✅ SUCCESS")
             try:
                 result = response.json()
                 if isinstance(result, list):
-                    print(f"   Returned {len(result)} items")
+                    out.append(f"   Returned {len(result)} items")
                     if len(result) > 0:
-                        print(f"   First item: {json.dumps(result[0], indent=2, default=str)[:200]}...")
+                        out.append(f"   First item: {_dump(result[0])[:200]}...")
                 else:
-                    print(f"   Response: {json.dumps(result, indent=2, default=str)[:300]}")
+                    out.append(f"   Response: {_dump(result)[:300]}")
             except:
-                print(f"   Response: {response.text[:200]}")
+                out.append(f"   Response: {response.text[:200]}")
         else:
-            print("❌ FAILED")
-            print(f"   Error: {response.text[:200]}")
+            out.append("❌ FAILED")
+            out.append(f"   Error: {response.text[:200]}")
         
-        return response.status_code < 400
+        return response.status_code < 400, "\n".join(out)
     except Exception as e:
-        print(f"\n{'='*60}")
-        print(f"{method} {endpoint}")
-        print(f"❌ ERROR: {str(e)}")
-        return False
+        out.append(f"❌ ERROR: {str(e)}")
+        return False, "\n".join(out)
 
-def main():
+async def main():
     print("🧪 Testing Analytics Studio APIs\n")
     
-    results = []
-    
-    # Test health
-    results.append(("Health Check", test_api("/health")))
-    
-    # Test Projects
-    results.append(("List Projects", test_api("/api/v1/projects")))
-    results.append(("Get Project", test_api("/api/v1/projects/1")))
-    
-    # Test Datasets
-    results.append(("List Datasets (all)", test_api("/api/v1/datasets")))
-    results.append(("List Datasets (project 1)", test_api("/api/v1/datasets?project_id=1")))
-    results.append(("Get Dataset", test_api("/api/v1/datasets/sales_data")))
-    
-    # Test Dashboards
-    results.append(("List Dashboards (all)", test_api("/api/v1/dashboards")))
-    results.append(("List Dashboards (project 1)", test_api("/api/v1/dashboards?project_id=1")))
-    results.append(("Get Dashboard", test_api("/api/v1/dashboards/1")))
-    
-    # Test Semantic
     semantic_schema = {
         "grain": "daily",
         "time_columns": ["sale_date"],
         "dimensions": [{"name": "region", "column": "region_name", "type": "string"}],
         "measures": [{"name": "revenue", "column": "amount", "type": "numeric", "aggregations": ["SUM"]}]
     }
-    results.append(("Validate Semantic", test_api("/api/v1/semantic/validate", "POST", {"schema_json": semantic_schema})))
     
-    # Test Calculations
-    results.append(("Validate Formula", test_api("/api/v1/calculations/validate", "POST", {
-        "formula": "revenue * 1.1",
-        "available_fields": ["revenue", "cost"]
-    })))
+    # (name, endpoint, method, data); the checks are independent and run concurrently
+    specs = [
+        # Health
+        ("Health Check", "/health", "GET", None),
+        # Projects
+        ("List Projects", "/api/v1/projects", "GET", None),
+        ("Get Project", "/api/v1/projects/1", "GET", None),
+        # Datasets
+        ("List Datasets (all)", "/api/v1/datasets", "GET", None),
+        ("List Datasets (project 1)", "/api/v1/datasets?project_id=1", "GET", None),
+        ("Get Dataset", "/api/v1/datasets/sales_data", "GET", None),
+        # Dashboards
+        ("List Dashboards (all)", "/api/v1/dashboards", "GET", None),
+        ("List Dashboards (project 1)", "/api/v1/dashboards?project_id=1", "GET", None),
+        ("Get Dashboard", "/api/v1/dashboards/1", "GET", None),
+        # Semantic
+        ("Validate Semantic", "/api/v1/semantic/validate", "POST", {"schema_json": semantic_schema}),
+        # Calculations
+        ("Validate Formula", "/api/v1/calculations/validate", "POST", {
+            "formula": "revenue * 1.1",
+            "available_fields": ["revenue", "cost"]
+        }),
+        # Dependency Safety
+        ("Check Dataset Usage", "/api/v1/dependency-safety/dataset/sales_data/usage", "GET", None),
+    ]
+    
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10) as client:
+        outcomes = await asyncio.gather(
+            *(test_api(client, endpoint, method, data) for _, endpoint, method, data in specs)
+        )
     
-    # Test Dependency Safety
-    results.append(("Check Dataset Usage", test_api("/api/v1/dependency-safety/dataset/sales_data/usage")))
+    results = []
+    for (name, *_), (passed, report) in zip(specs, outcomes):
+        print(report)
+        results.append((name, passed))
     
-    # Summary
-    print(f"\n{'='*60}")
-    print("📊 TEST SUMMARY")
-    print(f"{'='*60}")
+    # Summary, written in one go
     passed = sum(1 for _, result in results if result)
     total = len(results)
-    print(f"Passed: {passed}/{total}")
-    print(f"Failed: {total - passed}/{total}")
-    
-    if passed == total:
-        print("\n🎉 All tests passed!")
-    else:
-        print(f"\n⚠️  {total - passed} test(s) failed")
-    
-    print(f"\n{'='*60}")
+    summary = [
+        f"\n{'='*60}",
+        "📊 TEST SUMMARY",
+        f"{'='*60}",
+        f"Passed: {passed}/{total}",
+        f"Failed: {total - passed}/{total}",
+        "\n🎉 All tests passed!" if passed == total else f"\n⚠️  {total - passed} test(s) failed",
+        f"\n{'='*60}",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
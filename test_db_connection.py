@@ -25,18 +25,41 @@ DATABASE_URL = (
     f"@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
 )
 
+# Diagnostic statements, built once at import
+PING_SQL = text("SELECT 1 as test")
+COLUMNS_SQL = text("""
+    SELECT column_name, data_type, is_nullable
+    FROM information_schema.columns 
+    WHERE table_schema = 'public' 
+    AND table_name = 'sales_analytics'
+    ORDER BY ordinal_position
+""")
+TABLES_SQL = text("""
+    SELECT table_name 
+    FROM information_schema.tables 
+    WHERE table_schema = 'public'
+    ORDER BY table_name
+""")
+ROW_COUNT_SQL = text("SELECT COUNT(*) FROM public.sales_analytics")
+SAMPLE_ROWS_SQL = text("SELECT * FROM public.sales_analytics LIMIT 5")
+
 print(f"🔗 Connecting to: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
 
 
 async def test_connection():
     """Test database connection and query sales_analytics table."""
+    # Report lines are buffered and written once, including on failure
+    out: list[str] = []
     
     try:
         # Create engine
+        # Short-lived script: skip the per-checkout pre-ping round-trip; Step 1's
+        # SELECT 1 already proves (and warms) the connection
         engine = create_async_engine(
             DATABASE_URL,
             echo=False,
-            pool_pre_ping=True,
+            pool_pre_ping=False,
+            pool_recycle=600,
         )
         
         # Create session
@@ -48,94 +71,81 @@ async def test_connection():
         
         async with AsyncSessionLocal() as session:
             # Test 1: Basic connection
-            print("\n✅ Step 1: Testing basic connection...")
-            result = await session.execute(text("SELECT 1 as test"))
+            out.append("\n✅ Step 1: Testing basic connection...")
+            result = await session.execute(PING_SQL)
             row = result.fetchone()
-            print(f"   Connection successful! Query result: {row[0]}")
+            out.append(f"   Connection successful! Query result: {row[0]}")
             
-            # Test 2: Check if sales_analytics table exists
-            print("\n✅ Step 2: Checking if 'sales_analytics' table exists...")
-            table_check = await session.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name = 'sales_analytics'
-            """))
-            table_exists = table_check.fetchone()
+            # Test 2: Check if sales_analytics table exists. The column listing
+            # doubles as the existence check: no columns means no table.
+            out.append("\n✅ Step 2: Checking if 'sales_analytics' table exists...")
+            columns_result = await session.execute(COLUMNS_SQL)
+            columns = columns_result.fetchall()
             
-            if table_exists:
-                print(f"   ✓ Table 'public.sales_analytics' exists!")
+            if columns:
+                out.append(f"   ✓ Table 'public.sales_analytics' exists!")
             else:
-                print("   ⚠️  Table 'sales_analytics' NOT found in public schema")
+                out.append("   ⚠️  Table 'sales_analytics' NOT found in public schema")
                 
                 # List available tables
-                print("\n   Available tables in 'public' schema:")
-                tables_result = await session.execute(text("""
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public'
-                    ORDER BY table_name
-                """))
+                out.append("\n   Available tables in 'public' schema:")
+                tables_result = await session.execute(TABLES_SQL)
                 tables = tables_result.fetchall()
                 for t in tables:
-                    print(f"   - {t[0]}")
+                    out.append(f"   - {t[0]}")
                 return
             
             # Test 3: Get table structure
-            print("\n✅ Step 3: Getting table structure...")
-            columns_result = await session.execute(text("""
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns 
-                WHERE table_schema = 'public' 
-                AND table_name = 'sales_analytics'
-                ORDER BY ordinal_position
-            """))
-            columns = columns_result.fetchall()
-            
-            print(f"\n   📊 Table: public.sales_analytics")
-            print(f"   {'Column Name':<30} {'Data Type':<20} {'Nullable'}")
-            print(f"   {'-'*30} {'-'*20} {'-'*10}")
+            out.append("\n✅ Step 3: Getting table structure...")
+            out.append(f"\n   📊 Table: public.sales_analytics")
+            out.append(f"   {'Column Name':<30} {'Data Type':<20} {'Nullable'}")
+            out.append(f"   {'-'*30} {'-'*20} {'-'*10}")
             for col in columns:
-                print(f"   {col[0]:<30} {col[1]:<20} {col[2]}")
+                out.append(f"   {col[0]:<30} {col[1]:<20} {col[2]}")
+            
+            # Tests 4 and 5 are independent: run the count and the sample on
+            # two pooled connections at once
+            async def fetch_sample():
+                async with AsyncSessionLocal() as sample_session:
+                    result = await sample_session.execute(SAMPLE_ROWS_SQL)
+                    return result.fetchall(), list(result.keys())
+
+            count_result, (sample_rows, column_names) = await asyncio.gather(
+                session.execute(ROW_COUNT_SQL),
+                fetch_sample(),
+            )
             
             # Test 4: Get row count
-            print("\n✅ Step 4: Getting row count...")
-            count_result = await session.execute(text(
-                "SELECT COUNT(*) FROM public.sales_analytics"
-            ))
+            out.append("\n✅ Step 4: Getting row count...")
             row_count = count_result.scalar()
-            print(f"   Total rows: {row_count:,}")
+            out.append(f"   Total rows: {row_count:,}")
             
             # Test 5: Get sample data
-            print("\n✅ Step 5: Sample data (first 5 rows)...")
-            sample_result = await session.execute(text(
-                "SELECT * FROM public.sales_analytics LIMIT 5"
-            ))
-            sample_rows = sample_result.fetchall()
-            column_names = sample_result.keys()
-            
-            print(f"\n   Columns: {list(column_names)}")
-            print(f"\n   Sample rows:")
+            out.append("\n✅ Step 5: Sample data (first 5 rows)...")
+            out.append(f"\n   Columns: {list(column_names)}")
+            out.append(f"\n   Sample rows:")
             for i, row in enumerate(sample_rows, 1):
-                print(f"   Row {i}: {dict(zip(column_names, row))}")
+                out.append(f"   Row {i}: {dict(zip(column_names, row))}")
             
         # Cleanup
         await engine.dispose()
         
-        print("\n" + "="*60)
-        print("✅ ALL TESTS PASSED! Database connection is working.")
-        print("="*60)
+        out.append("\n" + "="*60)
+        out.append("✅ ALL TESTS PASSED! Database connection is working.")
+        out.append("="*60)
         
         return True
         
     except Exception as e:
-        print(f"\n❌ CONNECTION ERROR: {type(e).__name__}")
-        print(f"   {str(e)}")
-        print("\n💡 Troubleshooting:")
-        print("   1. Check if password is correct in DB_CONFIG")
-        print("   2. Ensure PostgreSQL is running on port 5430")
-        print("   3. Verify database name is 'analytics-llm'")
+        out.append(f"\n❌ CONNECTION ERROR: {type(e).__name__}")
+        out.append(f"   {str(e)}")
+        out.append("\n💡 Troubleshooting:")
+        out.append("   1. Check if password is correct in DB_CONFIG")
+        out.append("   2. Ensure PostgreSQL is running on port 5430")
+        out.append("   3. Verify database name is 'analytics-llm'")
         return False
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+"""Keyset pagination of ProjectService.list_projects."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models  # noqa: F401  (registers all tables on Base.metadata)
+from app.core.database import Base
+from app.models.project import Project
+from app.services.project_service import ProjectService
+
+
+_TIE = datetime(2025, 10, 1, 12, 0, 0)
+
+
+def _tied_projects() -> list[Project]:
+    """Ids 1-3 tie on updated_at; id 4 is newer, id 5 older."""
+    return [
+        Project(name="a", created_by="t", updated_at=_TIE),
+        Project(name="b", created_by="t", updated_at=_TIE),
+        Project(name="c", created_by="t", updated_at=_TIE),
+        Project(name="d", created_by="t", updated_at=_TIE + timedelta(seconds=1)),
+        Project(name="e", created_by="t", updated_at=_TIE - timedelta(seconds=1)),
+    ]
+
+
+async def _page_through(
+    projects: list[Project], page_size: int, tz_aware_cursor: bool = False
+) -> list[int]:
+    """Store projects and collect their ids by following the keyset cursor."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        session.add_all(projects)
+        await session.commit()
+
+        seen: list[int] = []
+        cursor = None
+        while True:
+            page = await ProjectService.list_projects(session, limit=page_size, cursor=cursor)
+            if not page:
+                break
+            seen.extend(p.id for p in page)
+            if len(seen) > len(projects):
+                break  # a repeated row would otherwise page forever
+            last = page[-1]
+            last_updated_at = last.updated_at
+            if tz_aware_cursor:
+                last_updated_at = last_updated_at.replace(tzinfo=timezone.utc)
+            cursor = (last_updated_at, last.id)
+
+    await engine.dispose()
+    return seen
+
+
+def test_keyset_pages_across_updated_at_tie():
+    assert asyncio.run(_page_through(_tied_projects(), page_size=2)) == [4, 3, 2, 1, 5]
+
+
+def test_keyset_single_row_pages_do_not_repeat_cursor_row():
+    assert asyncio.run(_page_through(_tied_projects(), page_size=1)) == [4, 3, 2, 1, 5]
+
+
+def test_keyset_accepts_timezone_aware_cursor():
+    seen = asyncio.run(_page_through(_tied_projects(), page_size=2, tz_aware_cursor=True))
+    assert seen == [4, 3, 2, 1, 5]
+
+
+def test_keyset_with_default_updated_at():
+    # Rows stamped by the column default must round-trip through the cursor
+    projects = [Project(name=str(i), created_by="t") for i in range(6)]
+    seen = asyncio.run(_page_through(projects, page_size=1))
+    assert sorted(seen) == [1, 2, 3, 4, 5, 6]
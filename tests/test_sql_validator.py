@@ -0,0 +1,39 @@
+"""Statement-type check of SQLValidator."""
+
+from app.services.sql_validator import SQLValidator, ValidationErrorType
+
+
+def _validate(sql: str):
+    return SQLValidator().validate(sql)
+
+
+def test_select_and_cte_are_allowed():
+    assert _validate("SELECT 1").is_valid
+    assert _validate("  select 1").is_valid
+    assert _validate("WITH t AS (SELECT 1 AS x) SELECT x FROM t").is_valid
+
+
+def test_keyword_prefix_is_not_select():
+    # The first keyword is read as a whole word, so SELECTED is not SELECT
+    result = _validate("SELECTED * FROM sales")
+    assert not result.is_valid
+    assert result.error_type == ValidationErrorType.NON_SELECT_QUERY
+    assert result.error_message.endswith("Found: SELECTED")
+
+
+def test_cte_needs_select_as_a_whole_word():
+    result = _validate("WITH t AS (SELECTED 1) DELETED")
+    assert not result.is_valid
+    assert result.error_message == "WITH clause (CTE) must contain a SELECT statement"
+
+
+def test_error_names_leading_token_when_not_a_keyword():
+    result = _validate("(SELECT 1)")
+    assert not result.is_valid
+    assert result.error_message.endswith("Found: (SELECT")
+
+
+def test_error_names_non_select_keyword():
+    result = _validate("UPDATE sales SET x = 1")
+    assert not result.is_valid
+    assert result.error_message.endswith("Found: UPDATE")